@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_wires__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    inputs = expe.crt_elements(
+        "Logic Input", [(i, 0, 0) for i in range(10000)], elementXYZ=True
+    )
+    outputs = expe.crt_elements(
+        "Logic Output", [(i, 1, 0) for i in range(10000)], elementXYZ=True
+    )
+
+    with Timer():
+        for a, b in zip(inputs, outputs):
+            crt_wire(a.o, b.i)
+    expe.clear_wires()
+
+    with Timer():
+        crt_wires_between([a.o for a in inputs], [b.i for b in outputs])
+    expe.clear_wires()
+
+    with Timer():
+        crt_wires_between([(a, 0) for a in inputs], [(b, 0) for b in outputs])
+    expe.clear_wires()
+
+    bus1 = lib.UnitPin(None, *(a.o for a in inputs))
+    bus2 = lib.UnitPin(None, *(b.i for b in outputs))
+    with Timer():
+        lib.crt_wires(bus1, bus2)
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.1454777717590332
+# time: 0.10780167579650879
+# time: 0.16809511184692383
+# time: 0.10114383697509766
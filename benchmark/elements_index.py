@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+ELEMENTS_COUNT = 100000
+
+with Experiment(
+    OpenMode.crt, "__benchmark_elements_index__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    elements = [
+        Logic_Input(i % 1000, i // 1000, 0, elementXYZ=True)
+        for i in range(ELEMENTS_COUNT)
+    ]
+
+    # 删除元件与查找交替进行
+    with Timer():
+        for a_element in elements[: ELEMENTS_COUNT // 4]:
+            expe.del_element(a_element)
+            elements[-1].get_index()
+            expe.get_element_from_index(expe.get_elements_count() // 2)
+
+    print(expe.get_elements_count())
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.9880974292755127
+# 75000
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+ELEMENTS_COUNT = 100000
+
+with Experiment(
+    OpenMode.crt, "__benchmark_elements_position__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    with Timer():
+        elements = [
+            Logic_Input(i % 1000, i // 1000, 0, elementXYZ=True)
+            for i in range(ELEMENTS_COUNT)
+        ]
+
+    with Timer():
+        for a_element in elements:
+            x, y, z = a_element.get_position()
+            a_element.set_position(x, y, z + 1, elementXYZ=True)
+
+    with Timer():
+        for a_element in elements[: ELEMENTS_COUNT // 10]:
+            expe.del_element(a_element)
+
+    print(expe.get_elements_count())
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 5.0109171867370605
+# time: 2.0882961750030518
+# time: 0.24553728103637695
+# 90000
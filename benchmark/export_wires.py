@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_export__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    gates = expe.crt_elements(
+        "Full Adder", [(i, 0, 0) for i in range(10000)], elementXYZ=True
+    )
+    for a, b in zip(gates, gates[1:]):
+        crt_wire(a.o_up, b.i_up)
+        crt_wire(a.o_low, b.i_mid)
+
+    with Timer():
+        expe.export("__benchmark_export__.pl.py", "__benchmark_export__")
+
+    os.remove("__benchmark_export__.pl.py")
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.10588622093200684
@@ -0,0 +1,43 @@
+import os
+import sys
+import subprocess
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_json_backend__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    expe.crt_elements("And Gate", [(i, 0, 0) for i in range(50000)], elementXYZ=True)
+    expe.save(no_print_info=True)
+    sav_path = expe.SAV_PATH
+    expe.close()
+
+# 后端在导入physicsLab时确定, 因此在子进程中分别测试
+CODE = f"""
+import sys
+sys.path.append({os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+from test_tool import Timer
+from physicsLab import element, _json
+print(_json.BACKEND)
+with Timer():
+    for _ in range(10):
+        element._open_sav({sav_path!r})
+"""
+
+for backend in ("json", "orjson"):
+    subprocess.run(
+        [sys.executable, "-c", CODE],
+        env={**os.environ, "PHYSICSLAB_JSON_BACKEND": backend},
+        check=True,
+    )
+
+Experiment(OpenMode.load_by_sav_name, "__benchmark_json_backend__").close(delete=True)
+
+# -- outputs --
+# json
+# time: 1.2644281387329102
+# orjson
+# time: 0.5833876132965088
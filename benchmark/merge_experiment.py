@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_merge_module__", ExperimentType.Circuit, force_crt=True
+) as module:
+    gates = module.crt_elements(
+        "And Gate", [(i, 0, 0) for i in range(100)], elementXYZ=True
+    )
+    for a, b in zip(gates, gates[1:]):
+        crt_wire(a.o, b.i_up)
+
+    with Experiment(
+        OpenMode.crt, "__benchmark_merge__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        # 将100个元件, 99根导线的模块平铺100次
+        with Timer():
+            for i in range(100):
+                expe.merge(module, 0, i, 0, elementXYZ=True)
+        expe.close(delete=True)
+
+    module.close(delete=True)
+
+# -- outputs --
+# copy.deepcopy
+# time: 1.0630128689999765
+# 只复制data
+# time: 0.3497433662414551
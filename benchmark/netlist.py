@@ -0,0 +1,61 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+
+def naive_fan_out(expe, a_pin) -> int:
+    """每次查询都遍历所有导线求出该引脚所在的网络"""
+    adjacency = {}
+    for a_wire in expe.Wires:
+        adjacency.setdefault(a_wire.Source, []).append(a_wire.Target)
+        adjacency.setdefault(a_wire.Target, []).append(a_wire.Source)
+    net, stack = {a_pin}, [a_pin]
+    while len(stack) != 0:
+        for b_pin in adjacency.get(stack.pop(), ()):
+            if b_pin not in net:
+                net.add(b_pin)
+                stack.append(b_pin)
+    return sum(isinstance(p, InputPin) for p in net) - isinstance(a_pin, InputPin)
+
+
+with Experiment(
+    OpenMode.crt, "__benchmark_netlist__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    gates = expe.crt_elements(
+        "Yes Gate", [(i % 300, i // 300, 0) for i in range(30000)], elementXYZ=True
+    )
+    # 每10个是门中的第一个驱动其余的9个是门
+    crt_wires_between(
+        [gates[i - i % 10].o for i in range(len(gates)) if i % 10 != 0],
+        [gates[i].i for i in range(len(gates)) if i % 10 != 0],
+    )
+    print(f"{expe.get_wires_count()} wires")
+
+    queries = [a.o for a in gates[::10]]
+    with Timer():
+        for a_pin in queries[:10]:
+            naive_fan_out(expe, a_pin)
+
+    with Timer():
+        netlist = expe.get_netlist()
+        for a_pin in queries:
+            netlist.count_fan_out(a_pin)
+
+    # 网表会随导线的删除与连接同步更新
+    with Timer():
+        for a, b in zip(gates[::10], gates[1::10]):
+            del_wire(a.o, b.i)
+            crt_wire(a.o, b.i)
+            netlist.count_fan_out(a.o)
+
+    expe.close(delete=True)
+
+# -- outputs --
+# 27000 wires
+# time: 0.7430903911590576
+# time: 0.3388364315032959
+# time: 0.21981167793273926
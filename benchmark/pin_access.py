@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_pins__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    adders = expe.crt_elements(
+        "Full Adder", [(i, 0, 0) for i in range(10000)], elementXYZ=True
+    )
+
+    # 第一次访问时会创建引脚
+    with Timer():
+        for a in adders:
+            a.i_up, a.i_mid, a.i_low, a.o_up, a.o_low
+
+    # 之后的访问只会返回已经创建的引脚
+    with Timer():
+        for _ in range(10):
+            for a in adders:
+                a.i_up, a.i_mid, a.i_low, a.o_up, a.o_low
+
+    with Timer():
+        for a in adders:
+            for b in (a.i_up, a.i_mid, a.i_low, a.o_up, a.o_low):
+                b.get_pin_name()
+
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.11240911483764648
+# time: 0.3942677974700928
+# time: 0.047304391860961914
@@ -0,0 +1,44 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+from physicsLab import element
+
+SAVS_COUNT = 1000
+
+for i in range(SAVS_COUNT):
+    with Experiment(
+        OpenMode.crt, f"__benchmark_search_{i}__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        expe.crt_elements("And Gate", [(j, 0, 0) for j in range(200)], elementXYZ=True)
+        expe.save(no_print_info=True)
+        expe.close()
+
+# 删除索引, 第一次查找需要读取所有存档以建立索引
+element._sav_indexes.clear()
+os.remove(element._SavIndex(Experiment.SAV_PATH_DIR)._path())
+with Timer():
+    search_experiment("__benchmark_search_not_exist__")
+
+# 存档目录未被修改时不会重新扫描目录
+with Timer():
+    for i in range(100):
+        search_experiment(f"__benchmark_search_{i}__")
+
+# 找不到存档时仍会重新扫描目录
+with Timer():
+    for _ in range(100):
+        search_experiment("__benchmark_search_not_exist__")
+
+for i in range(SAVS_COUNT):
+    Experiment(OpenMode.load_by_sav_name, f"__benchmark_search_{i}__").close(
+        delete=True
+    )
+
+# -- outputs --
+# time: 5.640884160995483
+# time: 0.0182037353515625
+# time: 0.4483983516693115
@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+with Experiment(
+    OpenMode.crt, "__benchmark_select__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    elements = expe.crt_elements(
+        "And Gate", [(i % 100, i // 100, 0) for i in range(10000)], elementXYZ=True
+    )
+
+    # 逐个调用set_position
+    with Timer():
+        for element in elements:
+            x, y, z = element.get_position()
+            element.set_position(x + 1, y, z, True)
+
+    with Timer():
+        expe.select(model_id="And Gate").translate(1, 0, 0, elementXYZ=True)
+
+    with Timer():
+        expe.select(model_id="And Gate").rotate(90)
+
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.18666911125183105
+# time: 0.0959465503692627
+# time: 0.09393835067749023
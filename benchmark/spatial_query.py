@@ -0,0 +1,43 @@
+import os
+import sys
+import random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+random.seed(0)
+points = [(random.uniform(-50, 50), random.uniform(-50, 50), 0) for _ in range(1000)]
+
+with Experiment(
+    OpenMode.crt, "__benchmark_spatial__", ExperimentType.Circuit, force_crt=True
+) as expe:
+    elements = expe.crt_elements(
+        "And Gate",
+        [(random.uniform(-50, 50), random.uniform(-50, 50), 0) for _ in range(20000)],
+    )
+
+    # 遍历所有元件
+    with Timer():
+        for x, y, z in points[:10]:
+            min(
+                elements,
+                key=lambda e: (e._position.x - x) ** 2 + (e._position.y - y) ** 2,
+            )
+
+    # 包含建立空间索引的时间
+    with Timer():
+        for x, y, z in points:
+            expe.nearest_element(x, y, z)
+
+    with Timer():
+        for x, y, z in points:
+            expe.elements_in_box((x - 1, y - 1, 0), (x + 1, y + 1, 0))
+
+    expe.close(delete=True)
+
+# -- outputs --
+# time: 0.09128403663635254
+# time: 0.16352081298828125
+# time: 0.04540586471557617
@@ -0,0 +1,48 @@
+import os
+import sys
+import itertools
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from test_tool import Timer
+from physicsLab import *
+
+for count in (10**4, 10**5):
+    with Experiment(
+        OpenMode.crt, "__benchmark_wire_set__", ExperimentType.Circuit, force_crt=True
+    ) as expe:
+        adders = expe.crt_elements(
+            "Full Adder", [(i, 0, 0) for i in range(count)], elementXYZ=True
+        )
+        # 每个全加器的5个引脚两两相连, 共 10 * count 根导线
+        wires = [
+            Wire(a, b)
+            for a_adder in adders
+            for a, b in itertools.combinations(
+                (
+                    a_adder.i_up,
+                    a_adder.i_mid,
+                    a_adder.i_low,
+                    a_adder.o_up,
+                    a_adder.o_low,
+                ),
+                2,
+            )
+        ]
+
+        print(f"{len(wires)} wires:")
+        with Timer():
+            for a_wire in wires:
+                expe._add_wire(a_wire)
+        with Timer():
+            for a_wire in wires:
+                expe._remove_wire(a_wire)
+        expe.close(delete=True)
+
+# -- outputs --
+# 100000 wires:
+# time: 0.27965760231018066
+# time: 0.20438599586486816
+# 1000000 wires:
+# time: 3.3888509273529053
+# time: 1.7735178470611572
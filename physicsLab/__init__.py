@@ -4,13 +4,14 @@
 from .physicsLab_version import __version__
 
 # 操作实验
-from .element import search_experiment, Experiment
+from .element import search_experiment, probe_sav, load_savs, Experiment
 from ._core import (
     ElementBase,
     get_current_experiment,
     elementXYZ_to_native,
     native_to_elementXYZ,
     ElementXYZ,
+    Selection,
 )
 
 # 实验, 标签类型
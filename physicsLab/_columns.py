@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import copy
+import itertools
+from array import array
+from collections.abc import MutableMapping
+
+from . import _tools
+from ._typing import List, Dict, Iterator, Tuple, num_type
+
+# 这些字段逐元件不同, 单独按列存放; 其余字段存放在共享的模板中
+_COLUMN_KEYS = ("Identifier", "Position", "Rotation")
+
+
+def _int_flags(vector: Tuple[num_type, num_type, num_type]) -> int:
+    """记录向量的各分量是否为int, 以便写回时保持存档中原有的写法"""
+    return sum(1 << i for i, num in enumerate(vector) if type(num) is int)
+
+
+def _get_vector(
+    nums: array, row: int, flags: int
+) -> Tuple[num_type, num_type, num_type]:
+    x, y, z = nums[3 * row : 3 * row + 3]
+    if flags & 0b1:
+        x = int(x)
+    if flags & 0b10:
+        y = int(y)
+    if flags & 0b100:
+        z = int(z)
+    return x, y, z
+
+
+def _format_vector(nums: array, row: int, flags: int) -> str:
+    x, y, z = _get_vector(nums, row, flags)
+    return f"{x},{y},{z}"
+
+
+class _ElementColumns:
+    """按列存放的电学元件存档 (struct of arrays)
+    坐标与角度存放在array中, Identifier存放在list中,
+    其余字段 (ModelID, Properties等) 相同的元件共享同一个模板dict,
+    修改某个元件的这些字段时才会为其复制一份模板 (写时复制)
+    """
+
+    __slots__ = (
+        "identifiers",
+        "positions",
+        "rotations",
+        "_int_flags",
+        "_raw_positions",
+        "_raw_rotations",
+        "_rests",
+        "_owned",
+    )
+
+    identifiers: List[str]
+    # 与存档中的字符串顺序一致, 即 x, z, y
+    positions: array
+    rotations: array
+    # 低3位对应Position, 高3位对应Rotation
+    _int_flags: bytearray
+    # 行 -> 存档中原有的字符串, 只记录按数值重新生成的字符串与之不同 (如"1.50", "0.10000000000000001") 的行
+    # 该行的Position/Rotation被写入之后即删除, 以保证未修改的元件写回存档时与原存档一致
+    _raw_positions: Dict[int, str]
+    _raw_rotations: Dict[int, str]
+    _rests: List[dict]
+    # 该行的模板是否是该行独有的
+    _owned: bytearray
+
+    def __init__(self) -> None:
+        self.identifiers = []
+        self.positions = array("d")
+        self.rotations = array("d")
+        self._int_flags = bytearray()
+        self._raw_positions = {}
+        self._raw_rotations = {}
+        self._rests = []
+        self._owned = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def extend(self, elements: List[dict]) -> range:
+        """将存档中的元件追加到末尾, 返回这些元件所在的行
+        会修改elements中的dict
+        """
+        positions = _tools.parse_vectors([element["Position"] for element in elements])
+        rotations = _tools.parse_vectors([element["Rotation"] for element in elements])
+
+        start = len(self)
+        templates: Dict[str, dict] = {}
+        for row, element, position, rotation in zip(
+            itertools.count(start), elements, positions, rotations
+        ):
+            self.identifiers.append(element["Identifier"])
+            for raw, vector, raws in (
+                (element["Position"], position, self._raw_positions),
+                (element["Rotation"], rotation, self._raw_rotations),
+            ):
+                if raw != "{},{},{}".format(*vector):
+                    raws[row] = raw
+            for key in _COLUMN_KEYS:
+                element[key] = None
+            # 存档中的值只有json的类型, 其repr可以区分不同的值
+            rest = templates.setdefault(repr(element), element)
+            self._rests.append(rest)
+        self.positions.extend(itertools.chain.from_iterable(positions))
+        self.rotations.extend(itertools.chain.from_iterable(rotations))
+        self._int_flags.extend(
+            _int_flags(position) | _int_flags(rotation) << 3
+            for position, rotation in zip(positions, rotations)
+        )
+        self._owned.extend(bytes(len(elements)))
+
+        return range(start, len(self))
+
+    def get_position(self, row: int) -> Tuple[num_type, num_type, num_type]:
+        """获取该行的坐标 (x, y, z)"""
+        x, z, y = _get_vector(self.positions, row, self._int_flags[row])
+        return x, y, z
+
+    def _own(self, row: int) -> dict:
+        """获取该行独有的模板, 必要时复制共享的模板"""
+        if not self._owned[row]:
+            self._rests[row] = copy.deepcopy(self._rests[row])
+            self._owned[row] = 1
+        return self._rests[row]
+
+    def to_dict(self, row: int) -> dict:
+        """生成该行对应的存档中的dict (嵌套的dict可能与其他行共享)"""
+        res = self._rests[row].copy()
+        res["Identifier"] = self.identifiers[row]
+        res["Position"] = self.format_position(row)
+        res["Rotation"] = self.format_rotation(row)
+        return res
+
+    def format_position(self, row: int) -> str:
+        raw = self._raw_positions.get(row)
+        if raw is not None:
+            return raw
+        return _format_vector(self.positions, row, self._int_flags[row])
+
+    def format_rotation(self, row: int) -> str:
+        raw = self._raw_rotations.get(row)
+        if raw is not None:
+            return raw
+        return _format_vector(self.rotations, row, self._int_flags[row] >> 3)
+
+    def set_vector(self, row: int, key: str, vector: str) -> None:
+        """以存档中的字符串设置该行的Position或Rotation"""
+        nums = _tools.parse_vectors([vector])[0]
+        if key == "Position":
+            self._raw_positions.pop(row, None)
+            self.positions[3 * row : 3 * row + 3] = array("d", nums)
+            self._int_flags[row] = self._int_flags[row] & 0b111000 | _int_flags(nums)
+        else:
+            self._raw_rotations.pop(row, None)
+            self.rotations[3 * row : 3 * row + 3] = array("d", nums)
+            self._int_flags[row] = self._int_flags[row] & 0b111 | _int_flags(nums) << 3
+
+
+class _ElementRow(MutableMapping):
+    """元件在_ElementColumns中对应的行, 作为元件的data使用, 行为与dict一致"""
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: _ElementColumns, row: int) -> None:
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, key: str):
+        columns, row = self._columns, self._row
+        if key == "Identifier":
+            return columns.identifiers[row]
+        if key == "Position":
+            return columns.format_position(row)
+        if key == "Rotation":
+            return columns.format_rotation(row)
+
+        res = columns._rests[row][key]
+        if isinstance(res, (dict, list)):
+            # 返回的值可能被修改, 因此不能是共享的模板中的值
+            res = columns._own(row)[key]
+        return res
+
+    def __setitem__(self, key: str, value) -> None:
+        columns, row = self._columns, self._row
+        if key == "Identifier":
+            columns.identifiers[row] = value
+        elif key in ("Position", "Rotation"):
+            columns.set_vector(row, key, value)
+        else:
+            columns._own(row)[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _COLUMN_KEYS:
+            raise KeyError(f"{key} can not be deleted")
+        del self._columns._own(self._row)[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns._rests[self._row])
+
+    def __len__(self) -> int:
+        return len(self._columns._rests[self._row])
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __copy__(self) -> dict:
+        return self.__deepcopy__({})
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        # 复制出的元件不再与其他元件共享同一个_ElementColumns
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def to_dict(self) -> dict:
+        """生成该元件在存档中对应的dict"""
+        return self._columns.to_dict(self._row)
@@ -8,18 +8,24 @@
 import os
 import sys
 import abc
+import math
 import json
 import copy
 import time
+import marshal
+import operator
 import gzip
 import requests
 import platform
 
 from physicsLab import plAR
+from physicsLab import _json
 from physicsLab import _tools
 from physicsLab import _warn
 from physicsLab import errors
 from physicsLab import _colorUtils
+from ._columns import _ElementRow
+from ._spatial import _SpatialGrid
 from .web.api import User, _check_response
 from .enums import Category, Tag, ExperimentType, OpenMode
 from ._typing import (
@@ -30,8 +36,11 @@ from ._typing import (
     Self,
     Callable,
     Tuple,
+    Union,
     final,
     NoReturn,
+    Iterable,
+    Iterator,
 )
 
 
@@ -79,6 +88,214 @@ def get_current_experiment() -> "_Experiment":
     return _ExperimentStack.top()
 
 
+class _ElementList(list):
+    """按元件生成顺序存放元件的list
+    每个元件在加入时获得一个递增的序号 (stamp), 删除元件后该序号作废,
+    作废的序号过多时再统一重新编号; 存在作废的序号时通过树状数组(Fenwick tree)统计存活的序号,
+    因此判断元件是否存在是O(1)的, 获取index是O(log n)的
+    insert, sort等会打乱生成顺序的操作会重新编号, 是O(n)的
+    """
+
+    __slots__ = ("_element2stamp", "_stamps_count", "_fenwick")
+
+    # 元件 -> 元件的序号
+    _element2stamp: Dict["ElementBase", int]
+    # 已分配的序号数 (包括已作废的)
+    _stamps_count: int
+    # 树状数组, 下标从1开始, 统计每个序号是否存活; 在存在作废的序号且需要查询时才会生成
+    _fenwick: Optional[List[int]]
+
+    def __init__(self, elements: Iterable["ElementBase"] = ()) -> None:
+        super().__init__()
+        self._element2stamp = {}
+        self._stamps_count = 0
+        self._fenwick = None
+        self.extend(elements)
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def _renumber(self) -> None:
+        """按元件当前的顺序重新编号"""
+        self._element2stamp = {a_element: stamp for stamp, a_element in enumerate(self)}
+        self._stamps_count = len(self)
+        self._fenwick = None
+        errors.assert_true(
+            len(self._element2stamp) == len(self), "duplicate element in Elements"
+        )
+
+    def _get_fenwick(self) -> List[int]:
+        fenwick = self._fenwick
+        if fenwick is not None:
+            return fenwick
+
+        fenwick = [0] * (self._stamps_count + 1)
+        for stamp in self._element2stamp.values():
+            fenwick[stamp + 1] = 1
+        # O(n)建树: 每个节点将自身的值累加到父节点
+        size = len(fenwick)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                fenwick[parent] += fenwick[i]
+        self._fenwick = fenwick
+        return fenwick
+
+    def _prefix(self, stamp: int) -> int:
+        """序号小于stamp的存活的元件数"""
+        if self._stamps_count == len(self):  # 没有作废的序号
+            return stamp
+
+        fenwick = self._get_fenwick()
+        res = 0
+        while stamp > 0:
+            res += fenwick[stamp]
+            stamp &= stamp - 1
+        return res
+
+    def _discard_stamp(self, stamp: int) -> None:
+        """元件已从list中移除后, 作废其序号"""
+        fenwick = self._fenwick
+        if stamp == self._stamps_count - 1:
+            # 最后一个序号可以直接回收
+            self._stamps_count -= 1
+            if fenwick is not None:
+                fenwick.pop()
+        elif fenwick is not None:
+            i = stamp + 1
+            while i < len(fenwick):
+                fenwick[i] -= 1
+                i += i & -i
+
+        # 作废的序号过多时重新编号, 保证树状数组的大小与元件数成正比
+        if (self._stamps_count - len(self)) * 2 > self._stamps_count:
+            self._renumber()
+
+    def __contains__(self, element: object) -> bool:
+        try:
+            return element in self._element2stamp
+        except TypeError:  # unhashable
+            return super().__contains__(element)
+
+    def _check_new(
+        self, elements: List["ElementBase"], replaced: Iterable["ElementBase"] = ()
+    ) -> None:
+        """加入elements (并移除replaced) 之后, Elements中不能有重复的元件"""
+        replaced = set(replaced)
+        seen = set()
+        for a_element in elements:
+            if a_element in seen or (
+                a_element in self._element2stamp and a_element not in replaced
+            ):
+                raise ValueError(f"{a_element} is already in Elements")
+            seen.add(a_element)
+
+    def append(self, element: "ElementBase") -> None:
+        self._check_new([element])
+        self._append(element)
+
+    def _append(self, element: "ElementBase") -> None:
+        stamp = self._stamps_count
+        fenwick = self._fenwick
+        if fenwick is not None:
+            # 新节点的值为其覆盖的区间 (i - lowbit(i), i] 中存活的元件数
+            i = stamp + 1
+            fenwick.append(1 + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self._element2stamp[element] = stamp
+        self._stamps_count += 1
+        super().append(element)
+
+    def extend(self, elements: Iterable["ElementBase"]) -> None:
+        elements = list(elements)
+        self._check_new(elements)
+        for a_element in elements:
+            self._append(a_element)
+
+    def __iadd__(self, elements: Iterable["ElementBase"]) -> Self:
+        self.extend(elements)
+        return self
+
+    def remove(self, element: "ElementBase") -> None:
+        stamp = self._element2stamp.get(element)
+        if stamp is None:
+            raise ValueError(f"{element} is not in Elements")
+
+        super().__delitem__(self._prefix(stamp))
+        del self._element2stamp[element]
+        self._discard_stamp(stamp)
+
+    def pop(self, index: int = -1) -> "ElementBase":
+        element = super().pop(index)
+        self._discard_stamp(self._element2stamp.pop(element))
+        return element
+
+    def __delitem__(self, item) -> None:
+        if isinstance(item, slice):
+            super().__delitem__(item)
+            self._renumber()
+        else:
+            self.pop(item)
+
+    def index(
+        self, element: "ElementBase", start: int = 0, stop: int = sys.maxsize
+    ) -> int:
+        stamp = self._element2stamp.get(element)
+        if stamp is None:
+            raise ValueError(f"{element} is not in Elements")
+
+        res = self._prefix(stamp)
+        if start != 0 or stop != sys.maxsize:
+            if res not in range(*slice(start, stop).indices(len(self))):
+                raise ValueError(f"{element} is not in Elements")
+        return res
+
+    def clear(self) -> None:
+        super().clear()
+        self._element2stamp.clear()
+        self._stamps_count = 0
+        self._fenwick = None
+
+    # 以下操作会打乱元件的顺序或替换元件, 因此需要重新编号
+
+    def insert(self, index: int, element: "ElementBase") -> None:
+        self._check_new([element])
+        super().insert(index, element)
+        self._renumber()
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            value = list(value)
+            self._check_new(value, self[item])
+        else:
+            self._check_new([value], [self[item]])
+        super().__setitem__(item, value)
+        self._renumber()
+
+    def __imul__(self, n: int) -> Self:
+        if n > 1 and len(self) != 0:
+            raise ValueError("elements in Elements can not be repeated")
+        super().__imul__(n)
+        self._renumber()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._renumber()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._renumber()
+
+
+# 流式保存存档时, 用于在json中标记需要被替换的部分
+_STATUS_SAVE_PLACEHOLDER = "\x00StatusSave\x00"
+_ELEMENTS_PLACEHOLDER = "\x00Elements\x00"
+_WIRES_PLACEHOLDER = "\x00Wires\x00"
+
+# 存档旁的二进制缓存文件的后缀, 见 element._SavCache
+_SAV_CACHE_SUFFIX = ".cache"
+
+
 def _check_not_closed(method: Callable) -> Callable:
     def res(self: "_Experiment", *args, **kwargs):
         errors.assert_true(isinstance(self, _Experiment))
@@ -103,8 +320,9 @@ class _Experiment:
 
     open_mode: OpenMode
     _position2elements: Dict[Tuple[num_type, num_type, num_type], List["ElementBase"]]
+    _element2position: Dict["ElementBase", Tuple[num_type, num_type, num_type]]
     _id2element: Dict[str, "ElementBase"]
-    Elements: List["ElementBase"]
+    Elements: _ElementList
     SAV_PATH: str
     PlSav: dict
     CameraSave: dict
@@ -112,6 +330,12 @@ class _Experiment:
     TargetRotation: _tools.position
     # Only for compaatibility
     experiment_type: ExperimentType
+    # 上次保存时生成的导线的json, 导线被修改后置为None
+    _wires_json: Optional[str] = None
+    # 按物实坐标系的坐标索引元件的空间索引, 第一次进行空间查询时才会建立
+    _spatial_index: Optional[_SpatialGrid] = None
+    # 电学实验的网表 (circuit.Netlist), 第一次调用get_netlist时才会建立
+    _netlist = None
 
     def __init__(
         self,
@@ -120,7 +344,7 @@ class _Experiment:
             Tuple[num_type, num_type, num_type], List["ElementBase"]
         ],
         _id2element: Dict[str, "ElementBase"],
-        Elements: List["ElementBase"],
+        Elements: Union[List["ElementBase"], _ElementList],
         SAV_PATH: str,
         PlSav: dict,
         CameraSave: dict,
@@ -143,7 +367,7 @@ class _Experiment:
             )
         if not isinstance(Elements, list):
             raise TypeError(
-                f"Parameter Elements must be of type `list`, but got `{Elements}` of type `{type(Elements).__name__}`"
+                f"Parameter Elements must be of type `list` or `_ElementList`, but got `{Elements}` of type `{type(Elements).__name__}`"
             )
         if not isinstance(SAV_PATH, str):
             raise TypeError(
@@ -172,7 +396,14 @@ class _Experiment:
 
         self.open_mode = open_mode
         self._position2elements = _position2elements
+        self._element2position = {
+            a_element: position
+            for position, elements in _position2elements.items()
+            for a_element in elements
+        }
         self._id2element = _id2element
+        if not isinstance(Elements, _ElementList):
+            Elements = _ElementList(Elements)
         self.Elements = Elements
         self.SAV_PATH = SAV_PATH
         self.PlSav = PlSav
@@ -224,9 +455,15 @@ class _Experiment:
         """清空该实验的所有元件"""
         if self.experiment_type == ExperimentType.Circuit:
             self.Wires.clear()
+            self._pin2wires.clear()
+            self._wires_json = None
+            if self._netlist is not None:
+                self._netlist._clear()
         self.Elements.clear()
         self._position2elements.clear()
+        self._element2position.clear()
         self._id2element.clear()
+        self._spatial_index = None
         return self
 
     @_check_not_closed
@@ -245,32 +482,16 @@ class _Experiment:
         if element not in self.Elements:
             raise errors.ElementNotFound
 
-        identifier = element.data["Identifier"]
+        identifier = element._data["Identifier"]
 
         if self.experiment_type == ExperimentType.Circuit:
-            rest_wires = set()
-            for a_wire in self.Wires:
-                if (
-                    a_wire.Source.element_self.data["Identifier"] == identifier
-                    or a_wire.Target.element_self.data["Identifier"] == identifier
-                ):
-                    continue
+            for wires in list(self._pin2wires.get(element, {}).values()):
+                for a_wire in list(wires):
+                    self._remove_wire(a_wire)
+            self._pin2wires.pop(element, None)
 
-                rest_wires.add(a_wire)
-            self.Wires = rest_wires
-
-        for position, elements in self._position2elements.items():
-            can_break: bool = False
-            if element in elements:
-                elements.remove(element)
-                can_break = True
-            if len(elements) == 0:
-                del self._position2elements[position]
-
-            if can_break:
-                break
-        else:
-            errors.unreachable()
+        errors.assert_true(element in self._element2position)
+        self._remove_from_position_index(element)
 
         errors.assert_true(identifier in self._id2element.keys())
         del self._id2element[identifier]
@@ -280,6 +501,194 @@ class _Experiment:
 
         return self
 
+    def _remove_from_position_index(self, element: "ElementBase") -> None:
+        """将元件从坐标索引中移除 (元件不在索引中时什么也不做)"""
+        position = self._element2position.pop(element, None)
+        if position is None:
+            return
+        if self._spatial_index is not None:
+            self._spatial_index.discard(element)
+
+        elements = self._position2elements[position]
+        elements.remove(element)
+        if len(elements) == 0:
+            del self._position2elements[position]
+
+    def _add_to_position_index(self, element: "ElementBase") -> None:
+        """将元件按其当前坐标加入坐标索引"""
+        position = element._position
+        elements = self._position2elements.get(position)
+        if elements is None:
+            self._position2elements[position] = [element]
+        else:
+            elements.append(element)
+        self._element2position[element] = position
+        if self._spatial_index is not None:
+            self._spatial_index.add(element, _native_positions([element])[0])
+
+    def _reindex_positions(self, elements: List["ElementBase"]) -> None:
+        """元件的坐标被批量修改后, 一次性更新这些元件在坐标索引中的位置"""
+        moved = set(elements)
+        position2elements, element2position = (
+            self._position2elements,
+            self._element2position,
+        )
+        old_positions = {element2position.pop(element, None) for element in moved}
+        old_positions.discard(None)
+        for position in old_positions:
+            elements_here = position2elements[position]
+            if len(elements_here) == 1:
+                del position2elements[position]
+                continue
+            remained = [element for element in elements_here if element not in moved]
+            if len(remained) == 0:
+                del position2elements[position]
+            else:
+                position2elements[position] = remained
+
+        for element in elements:
+            position = element._position
+            position2elements.setdefault(position, []).append(element)
+            element2position[element] = position
+
+        if self._spatial_index is not None:
+            for element, position in zip(elements, _native_positions(elements)):
+                self._spatial_index.add(element, position)
+
+    def _get_spatial_index(self) -> _SpatialGrid:
+        """获取空间索引, 元件数与建立索引时相差过大时会重新建立以调整格子的大小"""
+        index = self._spatial_index
+        if index is None or not index.built_count / 4 <= len(index) <= max(
+            4 * index.built_count, 64
+        ):
+            elements = list(self._element2position)
+            index = _SpatialGrid(elements, _native_positions(elements))
+            self._spatial_index = index
+        return index
+
+    @_check_not_closed
+    def elements_in_box(
+        self,
+        corner1: Tuple[num_type, num_type, num_type],
+        corner2: Tuple[num_type, num_type, num_type],
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> List["ElementBase"]:
+        """获取坐标位于长方体内(含边界)的所有元件 (不保证顺序)
+
+        Args:
+            corner1, corner2: 长方体的两个对角的坐标
+            elementXYZ: 坐标是否为元件坐标系的坐标
+        """
+        (x1, y1, z1), (x2, y2, z2) = (
+            _to_native(self, corner1, elementXYZ),
+            _to_native(self, corner2, elementXYZ),
+        )
+        lo = (min(x1, x2), min(y1, y2), min(z1, z2))
+        hi = (max(x1, x2), max(y1, y2), max(z1, z2))
+        return self._get_spatial_index().in_box(lo, hi)  # type: ignore
+
+    @_check_not_closed
+    def nearest_element(
+        self,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> "ElementBase":
+        """获取距离(x, y, z)最近的元件
+
+        Args:
+            elementXYZ: x, y, z是否为元件坐标系的坐标
+
+        Raises:
+            ElementNotFound: 实验中没有元件
+        """
+        res = self._get_spatial_index().nearest(_to_native(self, (x, y, z), elementXYZ))
+        if res is None:
+            raise errors.ElementNotFound
+        return res  # type: ignore
+
+    @_check_not_closed
+    def is_occupied(
+        self,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        radius: num_type = 0,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> bool:
+        """(x, y, z)附近是否有元件, 即是否有元件的坐标与(x, y, z)在各个方向上的距离都不超过radius
+
+        Args:
+            radius: 物实坐标系中的距离
+            elementXYZ: x, y, z是否为元件坐标系的坐标
+        """
+        if not isinstance(radius, (int, float)) or radius < 0:
+            raise TypeError(
+                f"Parameter radius must be a non-negative `int | float`, but got `{radius}`"
+            )
+
+        x, y, z = _to_native(self, (x, y, z), elementXYZ)
+        return (
+            len(
+                self._get_spatial_index().in_box(
+                    (x - radius, y - radius, z - radius),
+                    (x + radius, y + radius, z + radius),
+                )
+            )
+            != 0
+        )
+
+    @_check_not_closed
+    def select(
+        self,
+        predicate: Optional[Callable[["ElementBase"], bool]] = None,
+        *,
+        model_id: Optional[str] = None,
+        box: Optional[
+            Tuple[
+                Tuple[num_type, num_type, num_type], Tuple[num_type, num_type, num_type]
+            ]
+        ] = None,
+        elementXYZ: Optional[bool] = None,
+    ) -> "Selection":
+        """选中同时满足所有条件的元件, 以便对其整体平移, 旋转或镜像
+
+        Args:
+            predicate: 以元件为参数, 返回是否选中该元件
+            model_id: 元件的ModelID (天体实验为Model)
+            box: 长方体的两个对角的坐标, 选中坐标位于该长方体内(含边界)的元件
+            elementXYZ: box是否为元件坐标系的坐标 (仅对电学实验有效)
+        """
+        if predicate is not None and not callable(predicate):
+            raise TypeError(
+                f"Parameter predicate must be callable, but got `{predicate}` of type `{type(predicate).__name__}`"
+            )
+        if not isinstance(model_id, (str, type(None))):
+            raise TypeError(
+                f"Parameter model_id must be of type `Optional[str]`, but got `{model_id}` of type `{type(model_id).__name__}`"
+            )
+
+        elements: List[ElementBase]
+        if box is None:
+            elements = list(self.Elements)
+        else:
+            elements = self.elements_in_box(*box, elementXYZ=elementXYZ)
+            elements.sort(key=self.Elements.index)
+        if model_id is not None:
+            elements = [
+                element
+                for element in elements
+                if element._data.get("ModelID", element._data.get("Model")) == model_id
+            ]
+        if predicate is not None:
+            elements = [element for element in elements if predicate(element)]
+
+        return Selection(self, elements)
+
     @_check_not_closed
     def get_element_from_position(
         self,
@@ -327,8 +736,69 @@ class _Experiment:
             raise errors.ExperimentTypeError
 
         self.Wires.clear()
+        self._pin2wires.clear()
+        self._wires_json = None
+        if self._netlist is not None:
+            self._netlist._clear()
         return self
 
+    def _add_wire(self, a_wire) -> None:
+        """将导线加入Wires, 并更新引脚到导线的索引 (导线已存在时什么也不做)"""
+        if a_wire in self.Wires:
+            return
+
+        self.Wires.add(a_wire)
+        self._wires_json = None
+        for a_pin in (a_wire.Source, a_wire.Target):
+            self._pin2wires.setdefault(a_pin.element_self, {}).setdefault(
+                a_pin._pin_label, set()
+            ).add(a_wire)
+        if self._netlist is not None:
+            self._netlist._add_wire(a_wire)
+
+    def _add_wires(self, wires) -> None:
+        """批量加入导线, 与对每根导线调用_add_wire等价"""
+        all_wires, pin2wires, netlist = self.Wires, self._pin2wires, self._netlist
+        count = len(all_wires)
+        for a_wire in wires:
+            all_wires.add(a_wire)
+            if len(all_wires) == count:
+                continue  # 导线已存在
+            count += 1
+
+            for element, label in a_wire._key:
+                label2wires = pin2wires.get(element)
+                if label2wires is None:
+                    pin2wires[element] = {label: {a_wire}}
+                    continue
+                label_wires = label2wires.get(label)
+                if label_wires is None:
+                    label2wires[label] = {a_wire}
+                else:
+                    label_wires.add(a_wire)
+            if netlist is not None:
+                netlist._add_wire(a_wire)
+        self._wires_json = None
+
+    def _remove_wire(self, a_wire) -> None:
+        """将导线从Wires与引脚到导线的索引中移除
+
+        Raises:
+            KeyError: 导线不存在
+        """
+        self.Wires.remove(a_wire)
+        self._wires_json = None
+        for a_pin in (a_wire.Source, a_wire.Target):
+            label2wires = self._pin2wires[a_pin.element_self]
+            wires = label2wires[a_pin._pin_label]
+            wires.discard(a_wire)
+            if len(wires) == 0:
+                del label2wires[a_pin._pin_label]
+            if len(label2wires) == 0:
+                del self._pin2wires[a_pin.element_self]
+        if self._netlist is not None:
+            self._netlist._remove_wire(a_wire)
+
     @_check_not_closed
     def get_wires_count(self) -> int:
         """获取当前导线数"""
@@ -337,20 +807,23 @@ class _Experiment:
 
         return len(self.Wires)
 
-    def __write(self) -> None:
+    def __status_save(self, elements, wires) -> dict:
+        """生成存档的StatusSave
+
+        Args:
+            elements: StatusSave中Elements对应的值
+            wires: StatusSave中Wires对应的值 (仅电学实验有效)
+        """
         if self.experiment_type == ExperimentType.Circuit:
-            status_save: dict = {
+            return {
                 "SimulationSpeed": 1.0,
-                "Elements": [a_element.data for a_element in self.Elements],
-                "Wires": [a_wire.release() for a_wire in self.Wires],
+                "Elements": elements,
+                "Wires": wires,
             }
         elif self.experiment_type == ExperimentType.Celestial:
-            status_save: dict = {
+            return {
                 "MainIdentifier": None,
-                "Elements": {
-                    a_element.data["Identifier"]: a_element.data
-                    for a_element in self.Elements
-                },
+                "Elements": elements,
                 "WorldTime": 0.0,
                 "ScalingName": "内太阳系",
                 "LengthScale": 1.0,
@@ -360,13 +833,15 @@ class _Experiment:
                 "Setting": None,
             }
         elif self.experiment_type == ExperimentType.Electromagnetism:
-            status_save: dict = {
+            return {
                 "SimulationSpeed": 1.0,
-                "Elements": [a_element.data for a_element in self.Elements],
+                "Elements": elements,
             }
         else:
             errors.unreachable()
 
+    def __write_camera_save(self) -> None:
+        """更新存档的创建时间与视角"""
         self.PlSav["Experiment"]["CreationDate"] = int(time.time() * 1000)
         self.PlSav["Summary"]["CreationDate"] = int(time.time() * 1000)
 
@@ -378,24 +853,106 @@ class _Experiment:
         )
         self.PlSav["Experiment"]["CameraSave"] = json.dumps(self.CameraSave)
 
-        self.PlSav["Experiment"]["StatusSave"] = json.dumps(
-            status_save, ensure_ascii=True, separators=(",", ": ")
-        )
+    def _iter_elements_json(
+        self, encode: Callable[[dict], str], incremental: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        """写入存档时, 依次获取每个元件的Identifier与json
+
+        Args:
+            incremental: 是否直接使用上次保存时生成的json (仅重新序列化此后获取过data的元件)
+        """
+        for a_element in self.Elements:
+            data = a_element._data
+            fragment = a_element._fragment if incremental else None
+            if fragment is None:
+                if isinstance(data, _ElementRow):
+                    # 直接由_ElementColumns中的列生成元件的dict
+                    # 为了节省内存, 不缓存按列存放的元件的json
+                    fragment = encode(data.to_dict())
+                else:
+                    fragment = a_element._fragment = encode(data)
+            yield data["Identifier"], fragment
+
+    def _iter_wires_data(self) -> Iterable[dict]:
+        """写入存档时, 依次获取每根导线对应的dict"""
+        return (a_wire.release() for a_wire in self.Wires)
+
+    def __write(self) -> None:
+        self.__write_camera_save()
+        self.PlSav["Experiment"]["StatusSave"] = "".join(self.__iter_status_save())
+
+    def __iter_status_save(self, incremental: bool = False) -> Iterator[str]:
+        """逐个元件, 导线地生成StatusSave对应的json字符串
+        拼接后与json.dumps(status_save, ensure_ascii=True, separators=(",", ": "))的结果完全一致
+
+        Args:
+            incremental: 是否直接使用上次保存时生成的元件与导线的json
+        """
+        encode = json.JSONEncoder(ensure_ascii=True, separators=(",", ": ")).encode
+
+        def iter_elements() -> Iterator[str]:
+            if self.experiment_type == ExperimentType.Celestial:
+                yield "{"
+                for i, (identifier, fragment) in enumerate(
+                    self._iter_elements_json(encode, incremental)
+                ):
+                    if i != 0:
+                        yield ","
+                    yield f"{encode(identifier)}: "
+                    yield fragment
+                yield "}"
+            else:
+                yield "["
+                for i, (_, fragment) in enumerate(
+                    self._iter_elements_json(encode, incremental)
+                ):
+                    if i != 0:
+                        yield ","
+                    yield fragment
+                yield "]"
+
+        def iter_wires() -> Iterator[str]:
+            # 导线未被增删时直接使用上次保存时生成的json
+            if self._wires_json is None or not incremental:
+                self._wires_json = f"[{','.join(map(encode, self._iter_wires_data()))}]"
+            yield self._wires_json
+
+        rest = encode(self.__status_save(_ELEMENTS_PLACEHOLDER, _WIRES_PLACEHOLDER))
+        placeholders = [(_ELEMENTS_PLACEHOLDER, iter_elements())]
+        if self.experiment_type == ExperimentType.Circuit:
+            placeholders.append((_WIRES_PLACEHOLDER, iter_wires()))
+
+        for placeholder, chunks in placeholders:
+            head, rest = rest.split(encode(placeholder))
+            yield head
+            yield from chunks
+        yield rest
 
     @_check_not_closed
     def save(
         self,
         target_path: Optional[str] = None,
         no_print_info: bool = False,
+        *,
+        compact: bool = False,
+        incremental: bool = False,
     ) -> Self:
         """以物实存档的格式导出实验
+        元件与导线会被逐个写入文件, 而不会先在内存中生成整个存档 (含转义) 的字符串
+        保存之后PlSav中的StatusSave与写入存档的一致
 
         Args:
             target_path: 将存档保存在此路径 (要求必须是文件的路径), 默认为 SAV_PATH
             no_print_info: 是否打印写入存档的元件数, 导线数(如果是电学实验的话)
+            compact: 是否不缩进存档, 以生成更小的文件
+            incremental: 是否直接使用上次保存时生成的json, 只重新序列化此后获取过data的元件
+                (保存之后仍修改此前获取的data或properties的引用时, 这些修改不会被写入存档)
         """
-        if not isinstance(target_path, (str, type(None))) or not isinstance(
-            no_print_info, bool
+        if (
+            not isinstance(target_path, (str, type(None)))
+            or not isinstance(no_print_info, bool)
+            or not isinstance(compact, bool)
+            or not isinstance(incremental, bool)
         ):
             raise TypeError()
 
@@ -404,19 +961,38 @@ class _Experiment:
         else:
             target_path = os.path.abspath(target_path)
 
-        self.__write()
+        self.__write_camera_save()
 
+        # StatusSave会被单独写入文件, 因此先用占位符代替
+        status_save = self.PlSav["Experiment"]["StatusSave"]
+        self.PlSav["Experiment"]["StatusSave"] = _STATUS_SAVE_PLACEHOLDER
         try:
             context: str = json.dumps(
-                self.PlSav, indent=2, ensure_ascii=False, separators=(",", ":")
+                self.PlSav,
+                indent=None if compact else 2,
+                ensure_ascii=False,
+                separators=(",", ":"),
             )
         except TypeError as e:
             # 通常由序列化出现 <Generate>导致
             print("TypeError: ", e, file=sys.stderr)
             errors.unreachable()
+        finally:
+            self.PlSav["Experiment"]["StatusSave"] = status_save
+        head, tail = context.split(json.dumps(_STATUS_SAVE_PLACEHOLDER))
 
+        # 写入文件的StatusSave, 保存之后写回PlSav, 使PlSav与存档一致
+        status_save_chunks: List[str] = []
         with open(target_path, "w", encoding="utf-8") as f:
-            f.write(context)
+            f.write(head)
+            f.write('"')
+            for chunk in self.__iter_status_save(incremental):
+                status_save_chunks.append(chunk)
+                # StatusSave只含ascii字符, 作为json字符串时只需要转义反斜杠与引号
+                f.write(chunk.replace("\\", "\\\\").replace('"', '\\"'))
+            f.write('"')
+            f.write(tail)
+        self.PlSav["Experiment"]["StatusSave"] = "".join(status_save_chunks)
 
         if not no_print_info:
             _colorUtils.cprint(
@@ -472,6 +1048,8 @@ class _Experiment:
             self.SAV_PATH.replace(".sav", ".jpg")
         ):  # 用存档生成的实验无图片
             os.remove(self.SAV_PATH.replace(".sav", ".jpg"))
+        if os.path.exists(self.SAV_PATH + _SAV_CACHE_SUFFIX):
+            os.remove(self.SAV_PATH + _SAV_CACHE_SUFFIX)
 
     @_check_not_closed
     def close(self, *, delete: bool = False) -> None:
@@ -624,7 +1202,7 @@ class _Experiment:
 
         _check_response(submit_response, callback)
 
-        return submit_response.json(), submit_data
+        return _json.loads(submit_response.content), submit_data
 
     @_check_not_closed
     def upload(
@@ -777,19 +1355,19 @@ class _Experiment:
     @_check_not_closed
     def export(self, output_path: str = "temp.pl.py", sav_name: str = "temp") -> Self:
         """以physicsLab代码的形式导出实验"""
-        res: str = (
+        res: List[str] = [
             f"from physicsLab import *\n\n"
             f"expe = Experiment(OpenMode.crt, '{sav_name}', {self.experiment_type}, force_crt=True)\n"
-        )
+        ]
 
-        for a_element in self.Elements:
-            res += f"e{a_element.get_index()} = {str(a_element)}\n"
+        for index, a_element in enumerate(self.Elements, 1):
+            res.append(f"e{index} = {str(a_element)}\n")
         for a_wire in self.Wires:
-            res += str(a_wire) + "\n"
-        res += "expe.save()\nexpe.close()\n"
+            res.append(str(a_wire) + "\n")
+        res.append("expe.save()\nexpe.close()\n")
 
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(res)
+            f.write("".join(res))
 
         return self
 
@@ -805,13 +1383,14 @@ class _Experiment:
         """合并另一实验
         x, y, z, elementXYZ为重新设置要合并的实验的坐标系原点在self的坐标系的位置
         不是电学实验时, elementXYZ参数无效
+        合并进来的元件会被重新生成Identifier, 因此同一个实验可以被多次合并
         """
         if (
             not isinstance(other, _Experiment)
             or not isinstance(x, (int, float))
             or not isinstance(y, (int, float))
             or not isinstance(z, (int, float))
-            or not isinstance(elementXYZ, (bool, type(bool)))
+            or not isinstance(elementXYZ, (bool, type(None)))
         ):
             raise TypeError()
         if self.experiment_type != other.experiment_type:
@@ -821,67 +1400,68 @@ class _Experiment:
                 "can not merge to itself"
             )  # TODO 换一个更好的异常类型?
 
-        if self is other:
-            return self
-
-        identifier_to_element: dict = {}
+        elements: List[ElementBase] = list(other.Elements)
+        positions = _native_positions(elements)
+        is_circuit = self.experiment_type == ExperimentType.Circuit
+        is_elementXYZ = is_circuit and (
+            elementXYZ is True or (elementXYZ is None and self.is_elementXYZ)
+        )
 
-        # TODO 对天体与电学实验的支持可能不太好吧
-        for a_element in other.Elements:
-            a_element = copy.deepcopy(a_element, memo={id(a_element.experiment): self})
-            e_x, e_y, e_z = a_element.get_position()
-            if self.experiment_type == ExperimentType.Circuit:
-                if elementXYZ and not a_element.is_elementXYZ:
-                    e_x, e_y, e_z = native_to_elementXYZ(
-                        e_x,
-                        e_y,
-                        e_z,
-                        self._elementXYZ_origin_position,
-                        a_element.is_bigElement,
-                    )
-                elif not elementXYZ and a_element.is_elementXYZ:
-                    e_x, e_y, e_z = elementXYZ_to_native(
-                        e_x,
-                        e_y,
-                        e_z,
-                        self._elementXYZ_origin_position,
-                        a_element.is_bigElement,
-                    )
-            a_element.set_position(e_x + x, e_y + y, e_z + z, elementXYZ)
-            # set_Position已处理与_elements_position有关的操作
-            self.Elements.append(a_element)
+        old2new: Dict[ElementBase, ElementBase] = {}
+        for a_element, identifier, (e_x, e_y, e_z) in zip(
+            elements, _tools.randStrings(len(elements), 33), positions
+        ):
+            new_element = a_element._clone(self, identifier)
+            if is_elementXYZ:
+                origin, is_big = (
+                    self._elementXYZ_origin_position,
+                    a_element.is_bigElement,
+                )
+                e_x, e_y, e_z = native_to_elementXYZ(e_x, e_y, e_z, origin, is_big)
+                e_x, e_y, e_z = (
+                    round(e_x + x, 6),
+                    round(e_y + y, 6),
+                    round(e_z + z, 6),
+                )
+                new_element._position = _tools.position(e_x, e_y, e_z)
+                e_x, e_y, e_z = elementXYZ_to_native(e_x, e_y, e_z, origin, is_big)
+            else:
+                e_x, e_y, e_z = e_x + x, e_y + y, e_z + z
+                new_element._position = _tools.position(
+                    round(e_x, 6), round(e_y, 6), round(e_z, 6)
+                )
+            if is_circuit:
+                new_element.is_elementXYZ = is_elementXYZ
+            e_x, e_y, e_z = round(e_x, 6), round(e_y, 6), round(e_z, 6)
+            new_element._data["Position"] = f"{e_x},{e_z},{e_y}"
 
-            identifier_to_element[a_element.data["Identifier"]] = a_element
+            self.Elements.append(new_element)
+            self._id2element[identifier] = new_element
+            old2new[a_element] = new_element
+        self._reindex_positions(list(old2new.values()))
 
-        if (
-            self.experiment_type == ExperimentType.Circuit
-            and other.experiment_type == ExperimentType.Circuit
-        ):
+        if is_circuit:
             for a_wire in other.Wires:
-                a_wire = copy.deepcopy(
-                    a_wire,
-                    memo={
-                        id(a_wire.Source.element_self): identifier_to_element[
-                            a_wire.Source.element_self.data["Identifier"]
-                        ],
-                        id(a_wire.Target.element_self): identifier_to_element[
-                            a_wire.Target.element_self.data["Identifier"]
-                        ],
-                    },
-                )
-                self.Wires.add(
-                    a_wire
-                )  # TODO 这里wire不深拷贝，通过wire拿到的element不对吧
+                self._add_wire(a_wire._remap(old2new))
 
         return self
 
 
+# ElementBase._clone: 不可变, 可以直接共享的属性
+_CLONE_SHARED_ATTRS = frozenset(("_position", "is_elementXYZ"))
+# ElementBase._clone: 需要重新设置的属性
+# (_fragment为缓存, 与原元件的Identifier有关; _pins为电学元件的引脚的缓存, 引脚属于原元件)
+_CLONE_SKIPPED_ATTRS = frozenset(("experiment", "_data", "_fragment", "_pins"))
+
+
 class ElementBase:
     """三大类型实验的元件的基类"""
 
-    data: dict
+    _data: dict
     experiment: _Experiment
     _position: _tools.position
+    # 上次保存时生成的该元件的json, 通过data修改元件后置为None
+    _fragment: Optional[str] = None
 
     def __init__(self) -> None:
         raise NotImplementedError
@@ -891,6 +1471,21 @@ class ElementBase:
     def zh_name():
         raise NotImplementedError
 
+    @property
+    def data(self) -> dict:
+        """元件在存档中对应的dict
+        由于无法得知返回的dict是否会被修改, 获取data后该元件在下次保存时会被重新序列化
+        """
+        if self._fragment is not None:
+            self._fragment = None
+        return self._data
+
+    @data.setter
+    def data(self, data: dict) -> None:
+        if self._fragment is not None:
+            self._fragment = None
+        self._data = data
+
     def set_position(self, x: num_type, y: num_type, z: num_type) -> Self:
         """设置元件的位置"""
         if not isinstance(x, (int, float)):
@@ -910,18 +1505,13 @@ class ElementBase:
         errors.assert_true(hasattr(self, "experiment"))
         _Expe: _Experiment = self.experiment
 
-        for self_list in _Expe._position2elements.values():
-            if self in self_list:
-                self_list.remove(self)
+        _Expe._remove_from_position_index(self)
 
         errors.assert_true(hasattr(self, "data"))
         self.data["Position"] = f"{x},{z},{y}"
 
         errors.assert_true(hasattr(self, "_position"))
-        if self._position in _Expe._position2elements.keys():
-            _Expe._position2elements[self._position].append(self)
-        else:
-            _Expe._position2elements[self._position] = [self]
+        _Expe._add_to_position_index(self)
 
         return self
 
@@ -943,6 +1533,31 @@ class ElementBase:
         """获取元件的index (每创建一个元件, index就加1 (index从1开始))"""
         return self.experiment.Elements.index(self) + 1
 
+    @final
+    def _clone(self, experiment: _Experiment, identifier: str) -> Self:
+        """复制出属于experiment的, Identifier为identifier的同一元件
+        只复制data与元件的属性, 不会像copy.deepcopy那样遍历整个对象图, 不会加入experiment
+        """
+        cls = type(self)
+        res = cls.__new__(cls)
+        for key, value in self.__dict__.items():
+            if key in _CLONE_SHARED_ATTRS:
+                res.__dict__[key] = value
+            elif key not in _CLONE_SKIPPED_ATTRS:
+                res.__dict__[key] = copy.deepcopy(value)
+
+        data = self._data
+        if isinstance(data, _ElementRow):
+            data = data.to_dict()
+        try:
+            # data中只有json的类型, marshal可以快速地深拷贝它
+            res._data = marshal.loads(marshal.dumps(data))
+        except ValueError:
+            res._data = copy.deepcopy(data)
+        res._data["Identifier"] = identifier
+        res.experiment = experiment
+        return res
+
 
 class ElementXYZ:
     # 元件坐标系对应物实坐标系中的x, y, z的单位一
@@ -1012,3 +1627,268 @@ def native_to_elementXYZ(
     if is_bigElement:
         y -= ElementXYZ._Y_AMEND
     return x, y, z
+
+
+def _is_elementXYZ_frame(expe: _Experiment, elementXYZ: Optional[bool]) -> bool:
+    """用户给出的坐标是否为元件坐标系的坐标 (与set_position的elementXYZ参数含义一致)"""
+    if not isinstance(elementXYZ, (bool, type(None))):
+        raise TypeError(
+            f"Parameter elementXYZ must be of type `Optional[bool]`, but got value `{elementXYZ}` of type `{type(elementXYZ).__name__}`"
+        )
+    if expe.experiment_type != ExperimentType.Circuit:
+        if elementXYZ is not None:
+            raise errors.ExperimentTypeError
+        return False
+    return elementXYZ is True or (elementXYZ is None and expe.is_elementXYZ)
+
+
+def _to_native(
+    expe: _Experiment,
+    a_position: Tuple[num_type, num_type, num_type],
+    elementXYZ: Optional[bool],
+) -> Tuple[num_type, num_type, num_type]:
+    """将用户给出的坐标转换为物实坐标系的坐标"""
+    if len(a_position) != 3 or not all(
+        isinstance(num, (int, float)) for num in a_position
+    ):
+        raise TypeError(f"position must be `(x, y, z)`, but got value `{a_position}`")
+
+    x, y, z = a_position
+    if _is_elementXYZ_frame(expe, elementXYZ):
+        return elementXYZ_to_native(x, y, z, expe._elementXYZ_origin_position)
+    return x, y, z
+
+
+def _native_positions(
+    elements: List[ElementBase],
+) -> List[Tuple[num_type, num_type, num_type]]:
+    """获取元件在物实坐标系中的坐标, 即存档中的Position
+    (元件坐标系的原点可能在创建元件后被修改, 因此不能由_position与当前的原点推算)
+    """
+    res: List[Tuple[num_type, num_type, num_type]] = [(0, 0, 0)] * len(elements)
+    vectors, indexes = [], []
+    for i, element in enumerate(elements):
+        data = element._data
+        if type(data) is _ElementRow:
+            res[i] = data._columns.get_position(data._row)
+        else:
+            vectors.append(data["Position"])
+            indexes.append(i)
+    # 存档中的坐标的顺序为 x, z, y
+    for i, (x, z, y) in zip(indexes, _tools.parse_vectors(vectors)):
+        res[i] = (x, y, z)
+    return res
+
+
+def _frame_offsets(
+    expe: _Experiment,
+    elements: List[ElementBase],
+    positions: List[Tuple[num_type, num_type, num_type]],
+) -> List[Optional[Tuple[num_type, num_type, num_type]]]:
+    """创建元件时元件坐标系的原点在物实坐标系中的坐标 (含大体积元件的修正),
+    由元件的物实坐标与元件坐标系的坐标反推, 不是元件坐标系的元件为None
+    """
+    if expe.experiment_type != ExperimentType.Circuit:
+        return [None] * len(elements)
+
+    x_unit, y_unit, z_unit = ElementXYZ._X_UNIT, ElementXYZ._Y_UNIT, ElementXYZ._Z_UNIT
+    res: List[Optional[Tuple[num_type, num_type, num_type]]] = []
+    for element, (x, y, z) in zip(elements, positions):
+        if element.is_elementXYZ:
+            e_x, e_y, e_z = element._position
+            res.append((x - e_x * x_unit, y - e_y * y_unit, z - e_z * z_unit))
+        else:
+            res.append(None)
+    return res
+
+
+def _affine_xy(
+    positions: List[Tuple[num_type, num_type, num_type]],
+    matrix: Tuple[Tuple[num_type, num_type], Tuple[num_type, num_type]],
+    center: Tuple[num_type, num_type],
+    offset: Tuple[num_type, num_type, num_type],
+) -> List[Tuple[num_type, num_type, num_type]]:
+    """对每个坐标计算 matrix @ (p - center) + center + offset, matrix只作用于x, y"""
+    try:
+        import numpy
+    except ImportError:
+        (a, b), (c, d) = matrix
+        cx, cy = center
+        dx, dy, dz = offset
+        return [
+            (
+                a * (x - cx) + b * (y - cy) + cx + dx,
+                c * (x - cx) + d * (y - cy) + cy + dy,
+                z + dz,
+            )
+            for x, y, z in positions
+        ]
+
+    nums = numpy.array(positions, dtype=float).reshape(-1, 3)
+    nums[:, :2] = (nums[:, :2] - center) @ numpy.array(matrix, dtype=float).T + center
+    nums += offset
+    return nums.tolist()
+
+
+class Selection:
+    """由`_Experiment.select`选中的一组元件
+    平移, 旋转与镜像会一次性作用于所有元件: 参数只检查一次,
+    坐标在安装了numpy时由numpy一次性计算, 坐标索引也只会被批量更新一次
+    """
+
+    __slots__ = ("experiment", "elements")
+
+    experiment: _Experiment
+    elements: List[ElementBase]
+
+    def __init__(self, experiment: _Experiment, elements: List[ElementBase]) -> None:
+        self.experiment = experiment
+        self.elements = elements
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __iter__(self) -> Iterator[ElementBase]:
+        return iter(self.elements)
+
+    def __repr__(self) -> str:
+        return f"Selection({self.elements})"
+
+    def translate(
+        self,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> Self:
+        """平移所有元件
+
+        Args:
+            x, y, z: 平移的距离
+            elementXYZ: x, y, z是否为元件坐标系的距离
+        """
+        x, y, z = _tools.round_data(x), _tools.round_data(y), _tools.round_data(z)
+        if _is_elementXYZ_frame(self.experiment, elementXYZ):
+            x, y, z = (
+                x * ElementXYZ._X_UNIT,
+                y * ElementXYZ._Y_UNIT,
+                z * ElementXYZ._Z_UNIT,
+            )
+
+        return self._transform(((1, 0), (0, 1)), (0, 0), (x, y, z), None)
+
+    def rotate(
+        self,
+        angle: num_type,
+        center: Optional[Tuple[num_type, num_type]] = None,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> Self:
+        """绕竖直方向的轴旋转所有元件, 元件自身的角度也会一并旋转
+
+        Args:
+            angle: 旋转的角度, 方向与元件角度的z_r (见set_rotation) 一致
+            center: 旋转轴所在的(x, y), 默认为所有元件的坐标的中心
+            elementXYZ: center是否为元件坐标系的坐标
+        """
+        angle = _tools.round_data(angle)
+        if center is not None:
+            center = _to_native(self.experiment, (*center, 0), elementXYZ)[:2]
+
+        radians = math.radians(angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+        return self._transform(((cos, sin), (-sin, cos)), center, (0, 0, 0), (1, angle))
+
+    def mirror(
+        self,
+        axis: str,
+        center: Optional[num_type] = None,
+        *,
+        elementXYZ: Optional[bool] = None,
+    ) -> Self:
+        """以垂直于x轴或y轴的平面镜像所有元件的位置
+        元件的角度也会被相应地镜像, 但元件本身 (如引脚的位置) 无法被镜像
+
+        Args:
+            axis: "x"为镜像x坐标, "y"为镜像y坐标
+            center: 镜面的x坐标 (或y坐标), 默认为所有元件的坐标的中心
+            elementXYZ: center是否为元件坐标系的坐标
+        """
+        if axis not in ("x", "y"):
+            raise ValueError(f'Parameter axis must be "x" or "y", but got `{axis}`')
+        if center is not None:
+            center = _to_native(self.experiment, (center, center, 0), elementXYZ)[:2]
+
+        if axis == "x":
+            return self._transform(((-1, 0), (0, 1)), center, (0, 0, 0), (-1, 0))
+        return self._transform(((1, 0), (0, -1)), center, (0, 0, 0), (-1, 180))
+
+    def _transform(
+        self,
+        matrix: Tuple[Tuple[num_type, num_type], Tuple[num_type, num_type]],
+        center: Optional[Tuple[num_type, num_type]],
+        offset: Tuple[num_type, num_type, num_type],
+        z_r_map: Optional[Tuple[int, num_type]],
+    ) -> Self:
+        """对所有元件的坐标做仿射变换
+
+        Args:
+            z_r_map: (sign, angle), 元件角度的z_r变为 sign * z_r + angle; 为None时不修改角度
+        """
+        _Expe = self.experiment
+        if not _ExperimentStack.inside(_Expe):
+            raise errors.ExperimentClosedError
+        # 选中之后被删除的元件不再属于该实验, 不应被移动或重新加入索引
+        self.elements = [
+            element for element in self.elements if element in _Expe._element2position
+        ]
+        if len(self.elements) == 0:
+            return self
+
+        positions = _native_positions(self.elements)
+        offsets = _frame_offsets(_Expe, self.elements, positions)
+        if center is None:
+            xs = [x for x, _, _ in positions]
+            ys = [y for _, y, _ in positions]
+            center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        positions = _affine_xy(positions, matrix, center, offset)
+
+        x_unit, y_unit, z_unit = (
+            ElementXYZ._X_UNIT,
+            ElementXYZ._Y_UNIT,
+            ElementXYZ._Z_UNIT,
+        )
+        new_position = _tools.position
+        for element, (x, y, z), frame_offset in zip(self.elements, positions, offsets):
+            if frame_offset is None:
+                x, y, z = round(x, 6), round(y, 6), round(z, 6)
+                element._position = new_position(x, y, z)
+            else:
+                # 与set_position一致: _position为元件坐标系的坐标, 存档中为物实坐标
+                ox, oy, oz = frame_offset
+                element._position = new_position(
+                    round((x - ox) / x_unit, 6),
+                    round((y - oy) / y_unit, 6),
+                    round((z - oz) / z_unit, 6),
+                )
+                x, y, z = round(x, 6), round(y, 6), round(z, 6)
+            element._data["Position"] = f"{x},{z},{y}"
+            element._fragment = None
+
+        if z_r_map is not None:
+            self._rotate_elements(*z_r_map)
+        _Expe._reindex_positions(self.elements)
+
+        return self
+
+    def _rotate_elements(self, sign: int, angle: num_type) -> None:
+        """将元件角度的z_r变为 sign * z_r + angle"""
+        rotated = [element for element in self.elements if "Rotation" in element._data]
+        rotations = _tools.parse_vectors(
+            [element._data["Rotation"] for element in rotated]
+        )
+        # 存档中的角度的顺序为 x_r, z_r, y_r
+        for element, (x_r, z_r, y_r) in zip(rotated, rotations):
+            z_r = round((sign * z_r + angle) % 360, 6)
+            element._data["Rotation"] = f"{x_r},{z_r},{y_r}"
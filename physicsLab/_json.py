@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""解析json的后端
+安装了orjson或ujson时用它们解析json, 否则使用标准库json
+可以通过环境变量`PHYSICSLAB_JSON_BACKEND` (orjson, ujson, json) 指定后端
+
+生成存档时仍使用标准库json, 因为物实的存档格式依赖于ensure_ascii与separators,
+而orjson与ujson都无法生成与之完全一致的json
+"""
+import os
+import json
+
+from ._typing import Any, Callable, Union
+
+_BACKENDS = ("orjson", "ujson", "json")
+
+
+def _select_backend() -> str:
+    if "PHYSICSLAB_JSON_BACKEND" in os.environ:
+        backend = os.environ["PHYSICSLAB_JSON_BACKEND"]
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"PHYSICSLAB_JSON_BACKEND must be one of {_BACKENDS}, but got `{backend}`"
+            )
+        return backend
+
+    for backend in _BACKENDS[:-1]:
+        try:
+            __import__(backend)
+        except ImportError:
+            continue
+        return backend
+    return "json"
+
+
+BACKEND: str = _select_backend()
+
+_loads: Callable[[Any], Any]
+if BACKEND == "orjson":
+    import orjson
+
+    _loads = orjson.loads
+    # orjson可以直接解析bytes, memoryview等, 不必先解码为str
+    ACCEPTS_BUFFER = True
+elif BACKEND == "ujson":
+    import ujson
+
+    _loads = ujson.loads
+    ACCEPTS_BUFFER = False
+else:
+    _loads = json.loads
+    ACCEPTS_BUFFER = False
+
+
+def loads(s: Union[str, bytes, bytearray]) -> Any:
+    """解析json, 结果与json.loads一致
+    (orjson会将超出64位的整数解析为float, 物实的存档与返回体中不会出现这样的整数)
+
+    Raises:
+        json.JSONDecodeError: s不是合法的json
+    """
+    if _loads is json.loads:
+        return json.loads(s)
+
+    try:
+        return _loads(s)
+    except (ValueError, OverflowError):
+        # 后端不支持NaN, Infinity等json.loads支持的写法,
+        # 此时交给json.loads处理, 以保持相同的行为与异常
+        return json.loads(s)
+
+
+def loads_buffer(buffer) -> Any:
+    """直接解析utf-8编码的buffer (如mmap), 后端支持时不会将buffer复制为str
+    与loads不同, 后端解析失败时不会再交给json.loads, 调用者应自行回退到loads
+
+    Raises:
+        ValueError: buffer不是后端能解析的json
+    """
+    if not ACCEPTS_BUFFER:
+        return loads(str(buffer, "utf-8"))
+
+    # 必须及时释放memoryview, 否则buffer (如mmap) 无法关闭
+    with memoryview(buffer) as view:
+        return _loads(view)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import math
+
+from ._typing import List, Dict, Tuple, Optional, Iterator, num_type
+
+_Vector = Tuple[num_type, num_type, num_type]
+_Key = Tuple[int, int, int]
+
+
+class _SpatialGrid:
+    """均匀网格空间索引
+    将空间划分为边长为cell_size的立方体格子, 按元件所在的格子存放元件,
+    范围查询与最近邻查询只需访问附近的格子
+    """
+
+    __slots__ = ("cell_size", "built_count", "_cells", "_element2key", "_lo", "_hi")
+
+    cell_size: float
+    # 建立索引时的元件数, 元件数变化过大时应重新建立索引以调整格子的大小
+    built_count: int
+    _cells: Dict[_Key, Dict[object, _Vector]]
+    _element2key: Dict[object, _Key]
+    # 所有非空格子的坐标的下界与上界 (删除元件时不会收缩)
+    _lo: List[int]
+    _hi: List[int]
+
+    def __init__(self, elements: List[object], positions: List[_Vector]) -> None:
+        """以元件及其坐标建立索引, 格子的大小由元件的分布决定"""
+        self.cell_size = 1.0
+        if len(positions) != 0:
+            extent = max(
+                max(nums) - min(nums) for nums in zip(*positions)  # type: ignore
+            )
+            # 元件大多平铺在一个平面上, 使每个格子平均约有一个元件
+            if extent > 0:
+                self.cell_size = extent / math.sqrt(len(positions))
+
+        self.built_count = len(elements)
+        self._cells = {}
+        self._element2key = {}
+        self._lo = [0, 0, 0]
+        self._hi = [-1, -1, -1]
+        for element, position in zip(elements, positions):
+            self.add(element, position)
+
+    def __len__(self) -> int:
+        return len(self._element2key)
+
+    def _key(self, position: _Vector) -> _Key:
+        size = self.cell_size
+        x, y, z = position
+        return math.floor(x / size), math.floor(y / size), math.floor(z / size)
+
+    def add(self, element: object, position: _Vector) -> None:
+        """加入元件 (元件已在索引中时会先被移除)"""
+        self.discard(element)
+
+        key = self._key(position)
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = {element: position}
+            if len(self._cells) == 1:
+                self._lo, self._hi = list(key), list(key)
+            else:
+                for i in range(3):
+                    self._lo[i] = min(self._lo[i], key[i])
+                    self._hi[i] = max(self._hi[i], key[i])
+        else:
+            cell[element] = position
+        self._element2key[element] = key
+
+    def discard(self, element: object) -> None:
+        """移除元件 (元件不在索引中时什么也不做)"""
+        key = self._element2key.pop(element, None)
+        if key is None:
+            return
+
+        cell = self._cells[key]
+        del cell[element]
+        if len(cell) == 0:
+            del self._cells[key]
+
+    def in_box(self, lo: _Vector, hi: _Vector) -> List[object]:
+        """坐标位于长方体[lo, hi]内(含边界)的所有元件"""
+        (x1, y1, z1), (x2, y2, z2) = lo, hi
+        key_lo = [max(a, b) for a, b in zip(self._key(lo), self._lo)]
+        key_hi = [min(a, b) for a, b in zip(self._key(hi), self._hi)]
+        if any(a > b for a, b in zip(key_lo, key_hi)):
+            return []
+
+        cells_count = math.prod(b - a + 1 for a, b in zip(key_lo, key_hi))
+        cells: Iterator[Dict[object, _Vector]]
+        if cells_count > len(self._cells):
+            # 长方体覆盖的格子比非空的格子还多, 直接遍历非空的格子
+            cells = (
+                cell
+                for key, cell in self._cells.items()
+                if all(a <= k <= b for a, k, b in zip(key_lo, key, key_hi))
+            )
+        else:
+            (kx1, ky1, kz1), (kx2, ky2, kz2) = key_lo, key_hi
+            cells = (
+                self._cells[key]
+                for key in (
+                    (kx, ky, kz)
+                    for kx in range(kx1, kx2 + 1)
+                    for ky in range(ky1, ky2 + 1)
+                    for kz in range(kz1, kz2 + 1)
+                )
+                if key in self._cells
+            )
+
+        return [
+            element
+            for cell in cells
+            for element, (x, y, z) in cell.items()
+            if x1 <= x <= x2 and y1 <= y <= y2 and z1 <= z <= z2
+        ]
+
+    def _shell(self, center: _Key, r: int) -> Iterator[_Key]:
+        """与center的切比雪夫距离恰为r的, 位于非空格子的范围内的所有格子"""
+        (kx, ky, kz), lo, hi = center, self._lo, self._hi
+        zs_all = range(max(kz - r, lo[2]), min(kz + r, hi[2]) + 1)
+        zs_face = [kz_ for kz_ in (kz - r, kz + r) if lo[2] <= kz_ <= hi[2]]
+        for kx_ in range(max(kx - r, lo[0]), min(kx + r, hi[0]) + 1):
+            for ky_ in range(max(ky - r, lo[1]), min(ky + r, hi[1]) + 1):
+                if abs(kx_ - kx) == r or abs(ky_ - ky) == r:
+                    zs = zs_all
+                else:
+                    zs = zs_face
+                for kz_ in zs:
+                    yield kx_, ky_, kz_
+
+    def nearest(self, point: _Vector) -> Optional[object]:
+        """距离point最近的元件, 没有元件时返回None"""
+        if len(self._cells) == 0:
+            return None
+
+        px, py, pz = point
+        center = self._key(point)
+        max_r = max(
+            max(abs(c - a), abs(b - c)) for a, c, b in zip(self._lo, center, self._hi)
+        )
+        best, best_d2 = None, math.inf
+        visited = 0
+        for r in range(max_r + 1):
+            for key in self._shell(center, r):
+                visited += 1
+                cell = self._cells.get(key)
+                if cell is None:
+                    continue
+                for element, (x, y, z) in cell.items():
+                    d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if d2 < best_d2:
+                        best, best_d2 = element, d2
+            # 更外层的格子中的元件与point的距离至少为 r * cell_size
+            if best is not None and best_d2 <= (r * self.cell_size) ** 2:
+                return best
+            if visited > len(self._cells):
+                # 附近的空格子太多 (如point远离所有元件), 改为遍历所有非空的格子
+                break
+        else:
+            return best
+
+        for cell in self._cells.values():
+            for element, (x, y, z) in cell.items():
+                d2 = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                if d2 < best_d2:
+                    best, best_d2 = element, d2
+        return best
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
-from random import choice
+import json
+from random import choices
 from string import ascii_lowercase, ascii_letters, digits
 
 from collections import namedtuple
-from ._typing import num_type
+from ._typing import num_type, List, Tuple
 
 # TODO 元件坐标系也应该由这玩意负责
 # TODO 什么抽象玩意, 直接写成class罢
@@ -24,4 +25,64 @@ def randString(length: int, is_lower: bool = False) -> str:
         letters = ascii_lowercase
     else:
         letters = ascii_letters
-    return "".join(choice(letters + digits) for _ in range(length))
+    return "".join(choices(letters + digits, k=length))
+
+
+def randStrings(count: int, length: int, is_lower: bool = False) -> List[str]:
+    """一次性生成count个长度为length的随机字符串"""
+    if (
+        not isinstance(count, int)
+        or not isinstance(length, int)
+        or not isinstance(is_lower, bool)
+    ):
+        raise TypeError
+
+    if is_lower:
+        letters = ascii_lowercase
+    else:
+        letters = ascii_letters
+    chars = "".join(choices(letters + digits, k=count * length))
+    return [chars[i : i + length] for i in range(0, count * length, length)]
+
+
+def _parse_num(num: str) -> num_type:
+    try:
+        return int(num)
+    except ValueError:
+        return float(num)
+
+
+def parse_vectors(
+    vectors: List[str], as_array: bool = False
+) -> List[Tuple[num_type, num_type, num_type]]:
+    """一次性解析存档中形如"x,y,z"的坐标字符串 (如Position, Rotation)
+    整数仍会被解析为int, 与物实存档中的写法保持一致
+
+    Args:
+        vectors: 坐标字符串的列表
+        as_array: 是否返回形状为(n, 3)的numpy数组 (需要安装numpy)
+    """
+    if not isinstance(vectors, list) or not isinstance(as_array, bool):
+        raise TypeError
+
+    if any(vector.count(",") != 2 for vector in vectors):
+        raise ValueError("each vector must have exactly 3 components")
+
+    try:
+        # 将所有坐标拼接为一个json数组, 由json的C实现一次性解析
+        nums = json.loads(f"[{','.join(vectors)}]")
+    except json.JSONDecodeError:
+        # 存档中可能出现".5"之类json不支持的写法
+        nums = [_parse_num(num) for vector in vectors for num in vector.split(",")]
+    if len(nums) != 3 * len(vectors) or not all(
+        type(num) in (int, float) for num in nums
+    ):
+        raise ValueError("vectors must only contain numbers")
+
+    if as_array:
+        import numpy
+
+        return numpy.array(nums, dtype=float).reshape(-1, 3)
+
+    it = iter(nums)
+    return list(zip(it, it, it))
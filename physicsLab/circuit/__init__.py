@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """电学实验"""
+
 from ._circuit_core import *
+from ._netlist import Netlist
 
 # 元件类
 from .elements import *
@@ -21,14 +21,66 @@ from physicsLab._typing import (
     override,
     final,
     List,
+    Dict,
+    Tuple,
+    Union,
+    Iterable,
 )
 
 
+# 引脚的类 -> 其构造函数的签名, 用于解析以关键字参数创建引脚时的参数
+_pin_init_signatures: Dict[type, inspect.Signature] = {}
+
+
 class _PinMeta(type):
-    """该类仅仅用来实现以下效果:
-    通过 isinstance(cls, type(Pin)) 判断cls是否是引脚的class
+    """该类用来实现以下效果:
+    1. 通过 isinstance(cls, type(Pin)) 判断cls是否是引脚的class
+    2. 缓存Pin, InputPin与OutputPin: 同一个元件的同一个引脚总是同一个对象
     """
 
+    def __call__(cls, *args, **kwargs):
+        if cls not in _INTERNED_PIN_TYPES:
+            return super().__call__(*args, **kwargs)
+
+        if len(args) == 2 and len(kwargs) == 0:
+            element, pin_label = args
+        else:
+            # 以构造函数的签名解析参数 (各个类的参数名不同)
+            signature = _pin_init_signatures.get(cls)
+            if signature is None:
+                signature = _pin_init_signatures[cls] = inspect.signature(cls.__init__)
+            _, element, pin_label = signature.bind(None, *args, **kwargs).args
+        pins = element.__dict__.get("_pins")
+        if pins is None:
+            # 元件的引脚在第一次被访问时才创建缓存
+            pins = element._pins = {}
+        a_pin = pins.get(pin_label)
+        # 需要的是Pin时, 缓存的InputPin, OutputPin也可以直接使用
+        if a_pin is None or (cls is not Pin and type(a_pin) is not cls):
+            # 这几个类的构造函数只会设置以下两个属性, 直接设置以省去调用构造函数的开销
+            a_pin = pins[pin_label] = cls.__new__(cls)
+            a_pin.element_self = element
+            a_pin._pin_label = pin_label
+        return a_pin
+
+
+# 元件的类 -> 该类所有引脚的(名字, property), 由get_all_pins_property生成
+_pins_properties: Dict[type, Tuple[Tuple[str, property], ...]] = {}
+# 元件的类 -> {引脚的label: 引脚的名字}, 由Pin.get_pin_name生成
+_pin_label2name: Dict[type, Dict[int, str]] = {}
+
+
+def _get_label2name(element: "CircuitBase") -> Dict[int, str]:
+    """获取元件的 {引脚的label: 引脚的名字}"""
+    label2name = _pin_label2name.get(type(element))
+    if label2name is None:
+        label2name = {}
+        for name, a_pin in element.get_all_pins_property():
+            # 同一个引脚有多个名字时, 与之前一样取按名字排序后的第一个
+            label2name.setdefault(a_pin.fget(element)._pin_label, name)
+        _pin_label2name[type(element)] = label2name
+    return label2name
+
 
 # 对于逻辑电路，应该使用`InputPin` 和 `OutputPin`
 class Pin(metaclass=_PinMeta):
@@ -41,6 +93,8 @@ class Pin(metaclass=_PinMeta):
         self._pin_label: int = _pin_label
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Pin):
             return False
 
@@ -50,7 +104,7 @@ class Pin(metaclass=_PinMeta):
         )
 
     def __hash__(self) -> int:
-        return hash(self.element_self) + hash(self._pin_label)
+        return hash((self.element_self, self._pin_label))
 
     def export_str(self) -> str:
         """将引脚转换为 a_element.a_pin 的形式"""
@@ -61,18 +115,17 @@ class Pin(metaclass=_PinMeta):
         """获取该引脚在该元件中的名字
         @return: (e.g. i_up)
         """
-        for name, a_pin in self.element_self.get_all_pins_property():
-            if a_pin.fget(self.element_self) == self:
-                return name
-        errors.unreachable()
+        name = _get_label2name(self.element_self).get(self._pin_label)
+        if name is None:
+            errors.unreachable()
+        return name
 
     def get_wires(self) -> List["Wire"]:
         """获取该引脚上连接的所有导线"""
-        res = []
-        for a_wire in self.element_self.experiment.Wires:
-            if a_wire.Source == self or a_wire.Target == self:
-                res.append(a_wire)
-        return res
+        label2wires = self.element_self.experiment._pin2wires.get(self.element_self)
+        if label2wires is None:
+            return []
+        return list(label2wires.get(self._pin_label, ()))
 
 
 class InputPin(Pin):
@@ -89,10 +142,16 @@ class OutputPin(Pin):
         super().__init__(input_self, pinLabel)
 
 
+# 会被_PinMeta缓存的引脚的类 (Pin的其他子类如lib中的Vertex有各自的构造函数与属性, 不会被缓存)
+_INTERNED_PIN_TYPES = frozenset((Pin, InputPin, OutputPin))
+
+
 class Wire:
-    """导线"""
+    """导线
+    导线的两个引脚在创建后不应再被修改, 因为导线的哈希值在创建时就已确定
+    """
 
-    __slots__ = ("Source", "Target", "color")
+    __slots__ = ("Source", "Target", "color", "_key", "_hash")
 
     def __init__(
         self, source_pin: Pin, target_pin: Pin, color: WireColor = WireColor.blue
@@ -119,38 +178,71 @@ class Wire:
         self.Source: Pin = source_pin
         self.Target: Pin = target_pin
         self.color: WireColor = color
+        self._set_key()
+
+    def _set_key(self) -> None:
+        """计算与两个引脚的顺序无关的key及其哈希值
+        判断两个导线是否相等与导线的方向和颜色都无关
+        """
+        source, target = self.Source, self.Target
+        s_element, s_label = source.element_self, source._pin_label
+        t_element, t_label = target.element_self, target._pin_label
+        if id(s_element) < id(t_element) or (
+            s_element is t_element and s_label <= t_label
+        ):
+            self._key = ((s_element, s_label), (t_element, t_label))
+        else:
+            self._key = ((t_element, t_label), (s_element, s_label))
+        self._hash: int = hash(self._key)
 
     def __hash__(self) -> int:
-        return hash(self.Source) + hash(self.Target)
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Wire):
             return False
 
-        # 判断两个导线是否相等与导线的颜色无关
-        if (
-            self.Source == other.Source
-            and self.Target == other.Target
-            or self.Source == other.Target
-            and self.Target == other.Source
-        ):
-            return True
-        else:
-            return False
+        return self._hash == other._hash and self._key == other._key
+
+    def __reduce__(self):
+        # 复制后元件的id会改变, 必须重新计算key
+        return Wire, (self.Source, self.Target, self.color)
 
     def __repr__(self) -> str:
         return f"crt_wire({self.Source.export_str()}, {self.Target.export_str()}, color={self.color})"
 
+    def _remap(self, old2new: Dict[ElementBase, ElementBase]) -> "Wire":
+        """生成连接在old2new中对应的新元件的相同引脚上的导线"""
+        res = Wire.__new__(Wire)
+        res.Source = _remap_pin(self.Source, old2new)
+        res.Target = _remap_pin(self.Target, old2new)
+        res.color = self.color
+        res._set_key()
+        return res
+
     def release(self) -> dict:
         return {
-            "Source": self.Source.element_self.data["Identifier"],
+            "Source": self.Source.element_self._data["Identifier"],
             "SourcePin": self.Source._pin_label,
-            "Target": self.Target.element_self.data["Identifier"],
+            "Target": self.Target.element_self._data["Identifier"],
             "TargetPin": self.Target._pin_label,
             "ColorName": f"{self.color.value}色导线",
         }
 
 
+def _remap_pin(a_pin: Pin, old2new: Dict[ElementBase, ElementBase]) -> Pin:
+    cls = type(a_pin)
+    if cls in _INTERNED_PIN_TYPES:
+        return cls(old2new[a_pin.element_self], a_pin._pin_label)
+
+    res = cls.__new__(cls)
+    if hasattr(a_pin, "__dict__"):  # Pin的子类可能有额外的属性
+        res.__dict__.update(a_pin.__dict__)
+    res.element_self = old2new[a_pin.element_self]
+    res._pin_label = a_pin._pin_label
+    return res
+
+
 def crt_wire(*pins: Pin, color: WireColor = WireColor.blue) -> List[Wire]:
     """连接导线"""
     if not all(isinstance(a_pin, Pin) for a_pin in pins):
@@ -171,11 +263,85 @@ def crt_wire(*pins: Pin, color: WireColor = WireColor.blue) -> List[Wire]:
         source_pin, target_pin = pins[i], pins[i + 1]
         a_wire = Wire(source_pin, target_pin, color)
         res.append(a_wire)
-        _expe.Wires.add(a_wire)
+        _expe._add_wire(a_wire)
 
     return res
 
 
+def _to_pin(a_pin: Union[Pin, Tuple["CircuitBase", int]]) -> Pin:
+    """将(元件, 引脚的label)转换为引脚"""
+    if isinstance(a_pin, Pin):
+        return a_pin
+    if not isinstance(a_pin, tuple) or len(a_pin) != 2:
+        raise TypeError(
+            f"Each pin must be of type `Pin | tuple[CircuitBase, int]`, but got value {a_pin} of type `{type(a_pin).__name__}`"
+        )
+
+    element, label = a_pin
+    if not isinstance(element, CircuitBase):
+        raise TypeError(
+            f"Each element must be of type `CircuitBase`, but got value {element} of type `{type(element).__name__}`"
+        )
+    name = _get_label2name(element).get(label)
+    if name is None:
+        raise ValueError(f"{type(element).__name__} has no pin labeled {label}")
+    return getattr(element, name)
+
+
+def crt_wires_between(
+    sources: Iterable[Union[Pin, Tuple["CircuitBase", int]]],
+    targets: Iterable[Union[Pin, Tuple["CircuitBase", int]]],
+    *,
+    color: WireColor = WireColor.blue,
+) -> List[Wire]:
+    """批量连接导线: 依次连接sources与targets中对应的引脚
+    检查只会进行一次, 比逐个调用crt_wire快得多
+
+    Args:
+        sources: 引脚的序列 (如`lib.UnitPin`), 引脚也可以写为(元件, 引脚的label)
+        targets: 同上, 长度必须与sources相同
+        color: 导线的颜色
+
+    Returns:
+        连接的所有导线 (重复连接的导线也会被返回, 但不会重复加入实验)
+    """
+    if not isinstance(color, WireColor):
+        raise TypeError(
+            f"Parameter color must be of type `WireColor`, but got value {color} of type `{type(color).__name__}`"
+        )
+
+    source_pins = [_to_pin(a_pin) for a_pin in sources]
+    target_pins = [_to_pin(a_pin) for a_pin in targets]
+    if len(source_pins) != len(target_pins):
+        raise ValueError(
+            f"the length of sources ({len(source_pins)}) must be equal to "
+            f"the length of targets ({len(target_pins)})"
+        )
+
+    _expe = get_current_experiment()
+    if _expe.experiment_type != ExperimentType.Circuit:
+        raise errors.ExperimentTypeError
+    # 同一个元件往往有多个引脚, 每个元件只检查一次
+    elements = {a_pin.element_self for a_pin in source_pins}
+    elements.update(a_pin.element_self for a_pin in target_pins)
+    if any(a_element.experiment is not _expe for a_element in elements):
+        raise errors.InvalidWireError("can't link wire in two experiment")
+
+    res: List[Wire] = []
+    for source_pin, target_pin in zip(source_pins, target_pins):
+        a_wire = Wire.__new__(Wire)
+        a_wire.Source = source_pin
+        a_wire.Target = target_pin
+        a_wire.color = color
+        a_wire._set_key()
+        if a_wire._key[0] == a_wire._key[1]:
+            raise errors.InvalidWireError("can't link wire to itself")
+        res.append(a_wire)
+
+    _expe._add_wires(res)
+    return res
+
+
 def del_wire(source_pin: Pin, target_pin: Pin) -> None:
     """删除导线"""
     if not isinstance(source_pin, Pin):
@@ -191,7 +357,7 @@ def del_wire(source_pin: Pin, target_pin: Pin) -> None:
     if _expe.experiment_type != ExperimentType.Circuit:
         raise errors.ExperimentTypeError
 
-    _expe.Wires.remove(Wire(source_pin, target_pin))
+    _expe._remove_wire(Wire(source_pin, target_pin))
 
 
 # electricity class's metaClass
@@ -383,11 +549,17 @@ class CircuitBase(ElementBase, metaclass=_CircuitMeta):
     @classmethod
     def get_all_pins_property(cls):
         """获取该元件的所有引脚对应的property"""
-        for name, obj in inspect.getmembers(cls):
-            if isinstance(obj, property):
-                property_type = obj.fget.__annotations__.get("return")
-                if isinstance(property_type, type(Pin)):
-                    yield name, obj
+        res = _pins_properties.get(cls)
+        if res is None:
+            # inspect.getmembers很慢, 因此每个类只会检查一次
+            res = tuple(
+                (name, obj)
+                for name, obj in inspect.getmembers(cls)
+                if isinstance(obj, property)
+                and isinstance(obj.fget.__annotations__.get("return"), type(Pin))
+            )
+            _pins_properties[cls] = res
+        yield from res
 
     @final
     def rename(self, name: str) -> Self:
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+from physicsLab import errors
+from physicsLab.vendor import UndirectedGraph
+from ._circuit_core import Pin, InputPin, OutputPin, Wire, _get_label2name
+from physicsLab._typing import Optional, List, Set, Dict, Iterable
+
+# 元件的类 -> {引脚的label: 引脚的类}, 用于判断引脚是输入引脚还是输出引脚
+_pin_label2type: Dict[type, Dict[int, type]] = {}
+
+
+def _get_pin_type(a_pin: Pin) -> type:
+    """获取引脚对应的元件的property返回的引脚的类
+    (读取存档时创建的导线上的引脚都是Pin, 需要通过元件的property才能知道是否是输入/输出引脚)
+    """
+    if type(a_pin) is InputPin or type(a_pin) is OutputPin:
+        return type(a_pin)
+
+    element = a_pin.element_self
+    label2type = _pin_label2type.get(type(element))
+    if label2type is None:
+        label2type = {
+            label: type(getattr(element, name))
+            for label, name in _get_label2name(element).items()
+        }
+        _pin_label2type[type(element)] = label2type
+    return label2type.get(a_pin._pin_label, Pin)
+
+
+class _Net:
+    """一个网络: 通过导线相互连通的所有引脚"""
+
+    __slots__ = ("pins", "inputs_count", "outputs_count")
+
+    def __init__(self, a_pin: Pin) -> None:
+        self.pins: Set[Pin] = {a_pin}
+        self.inputs_count: int = 0
+        self.outputs_count: int = 0
+        self._count(a_pin)
+
+    def _count(self, a_pin: Pin) -> None:
+        pin_type = _get_pin_type(a_pin)
+        if pin_type is InputPin:
+            self.inputs_count += 1
+        elif pin_type is OutputPin:
+            self.outputs_count += 1
+
+    def add(self, a_pin: Pin) -> None:
+        self.pins.add(a_pin)
+        self._count(a_pin)
+
+    def merge(self, other: "_Net") -> None:
+        self.pins |= other.pins
+        self.inputs_count += other.inputs_count
+        self.outputs_count += other.outputs_count
+
+
+class Netlist:
+    """电路的网表: 以引脚为节点, 导线为边的无向图
+    通过`Experiment.get_netlist`获取, 之后连接或删除导线时会同步更新
+    """
+
+    __slots__ = ("graph", "_pin2net")
+
+    # 节点为引脚, 边为导线
+    graph: UndirectedGraph[Pin, Wire]
+    # 引脚 -> 引脚所在的网络, 在第一次查询网络时才会生成
+    _pin2net: Optional[Dict[Pin, _Net]]
+
+    def __init__(self, wires: Iterable[Wire]) -> None:
+        """一次性以所有导线建立网表"""
+        self.graph = UndirectedGraph()
+        self._pin2net = None
+        for a_wire in wires:
+            self._add_wire(a_wire)
+
+    def _add_wire(self, a_wire: Wire) -> None:
+        """导线已经被加入实验后调用"""
+        source, target, graph = a_wire.Source, a_wire.Target, self.graph
+        if source not in graph:
+            graph.add_node(source)
+        if target not in graph:
+            graph.add_node(target)
+        graph.construct_edge(source, target, a_wire)
+
+        pin2net = self._pin2net
+        if pin2net is None:
+            return
+        net1 = pin2net.get(source)
+        if net1 is None:
+            net1 = pin2net[source] = _Net(source)
+        net2 = pin2net.get(target)
+        if net2 is None:
+            net2 = pin2net[target] = _Net(target)
+        if net1 is net2:
+            return
+        # 将较小的网络合并到较大的网络中
+        if len(net1.pins) < len(net2.pins):
+            net1, net2 = net2, net1
+        net1.merge(net2)
+        for a_pin in net2.pins:
+            pin2net[a_pin] = net1
+
+    def _remove_wire(self, a_wire: Wire) -> None:
+        """导线已经从实验中移除后调用"""
+        source, target, graph = a_wire.Source, a_wire.Target, self.graph
+        graph.remove_edge(source, target)
+        for a_pin in (source, target):
+            if graph.degree(a_pin) == 0:
+                graph.remove_node(a_pin)
+
+        pin2net = self._pin2net
+        if pin2net is None:
+            return
+        # 删除导线可能使网络分裂, 只需重新生成导线原来所在的网络
+        for a_pin in pin2net[source].pins:
+            del pin2net[a_pin]
+        for a_pin in (source, target):
+            if a_pin in graph and a_pin not in pin2net:
+                net = self._collect_net(a_pin)
+                for b_pin in net.pins:
+                    pin2net[b_pin] = net
+
+    def _clear(self) -> None:
+        self.graph.clear()
+        self._pin2net = None
+
+    def _get_pin2net(self) -> Dict[Pin, _Net]:
+        pin2net = self._pin2net
+        if pin2net is not None:
+            return pin2net
+
+        pin2net = {}
+        for start in self.graph.nodes():
+            if start in pin2net:
+                continue
+            net = self._collect_net(start)
+            for a_pin in net.pins:
+                pin2net[a_pin] = net
+        self._pin2net = pin2net
+        return pin2net
+
+    def _collect_net(self, start: Pin) -> _Net:
+        """从start开始遍历与之连通的所有引脚"""
+        graph = self.graph
+        net = _Net(start)
+        stack = [start]
+        while len(stack) != 0:
+            for a_pin in graph.neighbors(stack.pop()):
+                if a_pin not in net.pins:
+                    net.add(a_pin)
+                    stack.append(a_pin)
+        return net
+
+    def _check_pin(self, a_pin: Pin) -> None:
+        if not isinstance(a_pin, Pin):
+            raise TypeError(
+                f"Parameter a_pin must be of type `Pin`, but got value {a_pin} of type `{type(a_pin).__name__}`"
+            )
+
+    def get_net(self, a_pin: Pin) -> Set[Pin]:
+        """获取与该引脚通过导线连通的所有引脚 (包括该引脚自身)"""
+        self._check_pin(a_pin)
+
+        net = self._get_pin2net().get(a_pin)
+        if net is None:
+            return {a_pin}
+        return set(net.pins)
+
+    def get_nets(self) -> List[Set[Pin]]:
+        """获取所有的网络 (没有连接导线的引脚不属于任何网络)"""
+        nets = {id(net): net for net in self._get_pin2net().values()}
+        return [set(net.pins) for net in nets.values()]
+
+    def is_connected(self, pin1: Pin, pin2: Pin) -> bool:
+        """两个引脚是否通过导线连通"""
+        self._check_pin(pin1)
+        self._check_pin(pin2)
+
+        if pin1 == pin2:
+            return True
+        pin2net = self._get_pin2net()
+        net = pin2net.get(pin1)
+        return net is not None and net is pin2net.get(pin2)
+
+    def count_fan_out(self, a_pin: Pin) -> int:
+        """与该引脚连通的输入引脚(InputPin)的数量 (不包括该引脚自身)"""
+        self._check_pin(a_pin)
+
+        net = self._get_pin2net().get(a_pin)
+        if net is None:
+            return 0
+        return net.inputs_count - (_get_pin_type(a_pin) is InputPin)
+
+    def count_fan_in(self, a_pin: Pin) -> int:
+        """与该引脚连通的输出引脚(OutputPin)的数量 (不包括该引脚自身)"""
+        self._check_pin(a_pin)
+
+        net = self._get_pin2net().get(a_pin)
+        if net is None:
+            return 0
+        return net.outputs_count - (_get_pin_type(a_pin) is OutputPin)
+
+    def find_path(self, source: Pin, target: Pin) -> Optional[List[Pin]]:
+        """通过导线从source到target的最短路径
+
+        Returns:
+            路径上的所有引脚 (包括source与target), 两个引脚不连通时返回None
+        """
+        if not self.is_connected(source, target):
+            return None
+        if source == target:
+            return [source]
+
+        graph = self.graph
+        prev: Dict[Pin, Pin] = {source: source}
+        frontier = [source]
+        while len(frontier) != 0:
+            next_frontier = []
+            for a_pin in frontier:
+                for neighbor in graph.neighbors(a_pin):
+                    if neighbor in prev:
+                        continue
+                    prev[neighbor] = a_pin
+                    if neighbor == target:
+                        res = [neighbor]
+                        while res[-1] != source:
+                            res.append(prev[res[-1]])
+                        res.reverse()
+                        return res
+                    next_frontier.append(neighbor)
+            frontier = next_frontier
+        errors.unreachable()
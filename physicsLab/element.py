@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
 import os
+import re
+import sys
+import mmap
+import codecs
+import struct
+import marshal
+import hashlib
 import copy
 import json
 import pathlib
+import concurrent.futures
 
+from . import _json
 from . import _tools
 from . import errors
 from . import savTemplate
@@ -13,55 +22,715 @@ from physicsLab import electromagnetism
 from .web.api import User
 from .web.api import anonymous_login
 from .savTemplate import Generate
-from .circuit._circuit_core import crt_wire, Pin
+from .circuit._circuit_core import Pin, Wire
+from ._columns import _ElementColumns, _ElementRow
 from .enums import ExperimentType, Category, OpenMode, WireColor
-from ._core import _Experiment, _ExperimentStack, _check_not_closed, ElementBase
-from ._typing import num_type, Optional, Union, List, overload, Tuple, Self, Dict
-
-
-def _get_all_pl_sav() -> List[str]:
-    """获取所有物实存档的文件名"""
-    savs = [i for i in os.walk(_Experiment.SAV_PATH_DIR)][0][-1]
-    return [aSav for aSav in savs if aSav.endswith(".sav")]
+from ._core import (
+    _Experiment,
+    _ExperimentStack,
+    _ElementList,
+    _check_not_closed,
+    ElementBase,
+    elementXYZ_to_native,
+    _SAV_CACHE_SUFFIX,
+)
+from ._typing import (
+    num_type,
+    Optional,
+    Union,
+    List,
+    overload,
+    Tuple,
+    Self,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Callable,
+    Any,
+    override,
+)
+
+# 存档开头的BOM -> 对应的编码
+_SAV_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# 用chardet检测编码时只读取存档开头的这么多字节
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+
+def _sav_encodings(buffer) -> Iterator[str]:
+    """按可能性依次给出存档可能的编码, 只根据存档开头的内容判断"""
+    for bom, encoding in _SAV_BOMS:
+        if buffer[: len(bom)] == bom:
+            yield encoding
+            return
+
+    yield "utf-8"
+    try:
+        import chardet
+    except ImportError:
+        yield "gbk"
+    else:
+        encoding = chardet.detect(buffer[:_ENCODING_SAMPLE_SIZE])["encoding"]
+        if encoding is not None:
+            yield encoding
 
 
 def _open_sav(sav_path) -> dict:
     """打开一个存档, 返回存档对应的dict
+    存档会被mmap到内存中并直接解码为字符串, 不会先将整个文件读入bytes
 
     Args:
         sav_path: 存档的绝对路径
     """
+    errors.assert_true(os.path.exists(sav_path))
 
-    def encode_sav(path: str, encoding: str) -> Optional[dict]:
-        try:
-            with open(path, encoding=encoding) as f:
-                d = json.loads(f.read().replace("\n", ""))
-        except (json.decoder.JSONDecodeError, UnicodeDecodeError):  # 文件不是物实存档
-            return None
+    with open(sav_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # 无法mmap空文件
+            raise errors.InvalidSavError
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for encoding in _sav_encodings(buffer):
+                if encoding == "utf-8" and _json.ACCEPTS_BUFFER:
+                    # 直接解析mmap, 不必先解码为str
+                    try:
+                        return _json.loads_buffer(buffer)
+                    except ValueError:
+                        pass
+                try:
+                    context = str(buffer, encoding)
+                except (UnicodeDecodeError, LookupError):
+                    continue
+                try:
+                    return _json.loads(context)
+                except json.decoder.JSONDecodeError:
+                    pass
+                # 字符串中可能含有未被转义的换行符
+                try:
+                    return _json.loads(context.replace("\n", ""))
+                except json.decoder.JSONDecodeError:  # 文件不是物实存档
+                    pass
+
+    raise errors.InvalidSavError
+
+
+class SavInfo(NamedTuple):
+    """存档的概要信息, 由`probe_sav`获取"""
+
+    # 存档名, 物实导出的存档没有存档名
+    internal_name: Optional[str]
+    # 实验类型, 不支持的实验类型为None
+    experiment_type: Optional[ExperimentType]
+    # 存档的标题 (Summary.Subject)
+    subject: Optional[str]
+    # 物实记录的元件数, physicsLab生成的存档中该值可能不准确
+    components: Optional[int]
+    # 实际的元件数与导线数, 仅在count_elements=True时被统计
+    elements_count: Optional[int]
+    wires_count: Optional[int]
+
+
+_PROBE_CHUNK_SIZE = 64 * 1024
+_WS_RE = re.compile(rb"\s*")
+_SCALAR_RE = re.compile(rb"[^,\]}\s]+")
+_CONTAINER_TOKEN_RE = re.compile(rb'"|[{\[]|[}\]]|[^"{}\[\]]+')
+# 未被转义的引号
+_QUOTE_RE = re.compile(rb'(?<!\\)(?:\\\\)*"')
+
+
+class _SavProber:
+    """从存档开头逐个扫描json的键, 只解码需要的值
+    StatusSave只会被跳过而不会被解析; 若StatusSave超出了已读取的部分,
+    则直接读取文件末尾, 从StatusSave结束的引号处继续扫描
+    """
+
+    # 需要获取的值在存档中的路径
+    __WANTED = {
+        ("Type",),
+        ("InternalName",),
+        ("Summary", "Subject"),
+        ("Components",),
+        ("Experiment", "Components"),
+    }
+
+    def __init__(self, f, size: int, count_elements: bool, allow_jump: bool) -> None:
+        self.f = f
+        self.size = size
+        self.count_elements = count_elements
+        self.allow_jump = allow_jump and not count_elements
+        self.jumped = False
+        self.values: Dict[Tuple[str, ...], object] = {}
+        self.elements_count: Optional[int] = None
+        self.wires_count: Optional[int] = None
+
+        f.seek(0)
+        if self.allow_jump and size > 2 * _PROBE_CHUNK_SIZE:
+            self.buf = f.read(_PROBE_CHUNK_SIZE)
+            self.complete = False
         else:
-            return d
+            self.buf = f.read()
+            self.complete = True
+
+    def _read_all(self) -> None:
+        self.buf += self.f.read()
+        self.complete = True
+
+    def _match(self, regex: "re.Pattern", pos: int) -> "re.Match":
+        m = regex.match(self.buf, pos)
+        # 匹配到了已读取部分的末尾, 说明这个token可能被截断了
+        if not self.complete and (m is None or m.end() >= len(self.buf)):
+            self._read_all()
+            m = regex.match(self.buf, pos)
+        if m is None:
+            raise ValueError(f"invalid sav at {pos}")
+        return m
+
+    def _byte(self, pos: int) -> bytes:
+        if pos >= len(self.buf) and not self.complete:
+            self._read_all()
+        if pos >= len(self.buf):
+            raise ValueError("unexpected end of sav")
+        return self.buf[pos : pos + 1]
+
+    def _ws(self, pos: int) -> int:
+        return self._match(_WS_RE, pos).end()
+
+    def _string_end(self, pos: int) -> int:
+        if self._byte(pos) != b'"':
+            raise ValueError(f"expect string at {pos}")
+        m = _QUOTE_RE.search(self.buf, pos + 1)
+        if m is None and not self.complete:
+            self._read_all()
+            m = _QUOTE_RE.search(self.buf, pos + 1)
+        if m is None:
+            raise ValueError("unterminated string")
+        return m.end()
+
+    def _value_end(self, pos: int) -> int:
+        """跳过一个json值, 返回该值结束的位置"""
+        c = self._byte(pos)
+        if c == b'"':
+            return self._string_end(pos)
+        if c not in (b"{", b"["):
+            return self._match(_SCALAR_RE, pos).end()
+
+        depth = 0
+        while True:
+            c = self._byte(pos)
+            if c == b'"':
+                pos = self._string_end(pos)
+                continue
+            if c in (b"{", b"["):
+                depth += 1
+            elif c in (b"}", b"]"):
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            else:
+                pos = self._match(_CONTAINER_TOKEN_RE, pos).end()
+                continue
+            pos += 1
+
+    def _decode(self, start: int, end: int) -> object:
+        # 与_open_sav一致, 忽略存档中的换行符
+        return _json.loads(self.buf[start:end].replace(b"\n", b""))
+
+    def _status_save_end(self, pos: int) -> int:
+        if self._byte(pos) != b'"':
+            raise ValueError("StatusSave must be a string")
+        if self.allow_jump and not self.complete:
+            m = _QUOTE_RE.search(self.buf, pos + 1)
+            if m is not None:
+                return m.end()
+            self.f.seek(max(len(self.buf), self.size - _PROBE_CHUNK_SIZE))
+            self.buf = self.f.read()
+            self.complete = True
+            self.jumped = True
+            # StatusSave内部的引号均被转义, 第一个未被转义的引号即为StatusSave的结尾
+            m = _QUOTE_RE.search(self.buf)
+            if m is None:
+                raise ValueError("unterminated StatusSave")
+            return m.end()
+
+        end = self._string_end(pos)
+        if self.count_elements:
+            self.elements_count = self.buf.count(b'\\"Identifier\\":', pos, end)
+            self.wires_count = self.buf.count(b'\\"SourcePin\\":', pos, end)
+        return end
+
+    def _found_all(self) -> bool:
+        if self.jumped or self.count_elements and self.elements_count is None:
+            return False
+        if ("InternalName",) not in self.values or ("Type",) not in self.values:
+            return False
+        return ("Summary", "Subject") in self.values and (
+            ("Components",) in self.values
+            or ("Experiment", "Components") in self.values
+        )
 
-    errors.assert_true(os.path.exists(sav_path))
+    def _member(self, path: Tuple[str, ...], pos: int) -> int:
+        if path in (("Experiment",), ("Summary",)) and self._byte(pos) == b"{":
+            return self._members(pos, path)
+        if path[-1] == "StatusSave" and len(path) <= 2:
+            return self._status_save_end(pos)
+
+        end = self._value_end(pos)
+        if path in self.__WANTED:
+            self.values[path] = self._decode(pos, end)
+        return end
+
+    def _members(self, pos: int, path: Tuple[str, ...]) -> int:
+        """扫描从pos开始的json对象, 返回该对象结束的位置"""
+        if self._byte(pos) != b"{":
+            raise ValueError(f"expect object at {pos}")
+        pos = self._ws(pos + 1)
+        if self._byte(pos) == b"}":
+            return pos + 1
+        while True:
+            key_end = self._string_end(pos)
+            key = self._decode(pos, key_end)
+            pos = self._ws(key_end)
+            if self._byte(pos) != b":":
+                raise ValueError(f"expect ':' at {pos}")
+            pos = self._member(path + (key,), self._ws(pos + 1))
+            if len(path) == 0 and self._found_all():
+                return pos
+            pos = self._ws(pos)
+            c = self._byte(pos)
+            if c == b"}":
+                return pos + 1
+            if c != b",":
+                raise ValueError(f"expect ',' at {pos}")
+            pos = self._ws(pos + 1)
+
+    def probe(self) -> SavInfo:
+        pos = 3 if self.buf.startswith(b"\xef\xbb\xbf") else 0
+        pos = self._members(self._ws(pos), ())
+        if self.jumped and self._ws(pos) != len(self.buf):
+            # 跳转到文件末尾后必须恰好扫描到文件结束, 否则说明跳转的位置不对
+            raise ValueError("trailing data in sav")
+
+        if ("Experiment", "Components") in self.values:
+            components = self.values[("Experiment", "Components")]
+        else:  # 物实导出的存档只含有.sav的Experiment部分
+            components = self.values.get(("Components",))
+        return _sav_info(
+            self.values.get(("InternalName",)),
+            self.values.get(("Type",)),
+            self.values.get(("Summary", "Subject")),
+            components,
+            self.elements_count,
+            self.wires_count,
+        )
 
-    res = encode_sav(sav_path, "utf-8")
-    if res is not None:
-        return res
 
+def _sav_info(
+    internal_name,
+    experiment_type,
+    subject,
+    components,
+    elements_count: Optional[int],
+    wires_count: Optional[int],
+) -> SavInfo:
     try:
-        import chardet
-    except ImportError:
-        for encoding in ("utf-8-sig", "gbk"):
-            res = encode_sav(sav_path, encoding)
-            if res is not None:
-                return res
+        experiment_type = ExperimentType(experiment_type)
+    except ValueError:
+        experiment_type = None
+    return SavInfo(
+        internal_name if isinstance(internal_name, str) else None,
+        experiment_type,
+        subject if isinstance(subject, str) else None,
+        components if isinstance(components, int) else None,
+        elements_count,
+        wires_count,
+    )
+
+
+def probe_sav(sav_path: str, count_elements: bool = False) -> SavInfo:
+    """只读取存档的概要信息(存档名, 实验类型, 标题等), 而不解析整个存档
+
+    Args:
+        sav_path: 存档的路径
+        count_elements: 是否统计存档中实际的元件数与导线数 (需要读取整个存档)
+    """
+    if not isinstance(sav_path, (str, pathlib.Path)):
+        raise TypeError(
+            f"Parameter sav_path must be of type `str | pathlib.Path`, but got value `{sav_path}` of type `{type(sav_path).__name__}`"
+        )
+    if not isinstance(count_elements, bool):
+        raise TypeError(
+            f"Parameter count_elements must be of type `bool`, but got value `{count_elements}` of type `{type(count_elements).__name__}`"
+        )
+
+    with open(sav_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        for allow_jump in (True, False):
+            try:
+                return _SavProber(f, size, count_elements, allow_jump).probe()
+            except (ValueError, UnicodeDecodeError):
+                # 跳转到文件末尾失败时, 再尝试完整地扫描一遍
+                if not allow_jump or count_elements or size <= 2 * _PROBE_CHUNK_SIZE:
+                    break
+
+    # 非utf-8编码等扫描失败的情况下, 解析整个存档
+    sav = _open_sav(sav_path)
+    if not isinstance(sav, dict):
+        raise errors.InvalidSavError
+    experiment = sav["Experiment"] if "Experiment" in sav else sav
+    if not isinstance(experiment, dict):
+        raise errors.InvalidSavError
+    summary = sav.get("Summary")
+    elements_count = wires_count = None
+    if count_elements and isinstance(experiment.get("StatusSave"), str):
+        status_save = _json.loads(experiment["StatusSave"])
+        elements_count = len(status_save.get("Elements") or ())
+        if status_save.get("Wires") is not None:
+            wires_count = len(status_save["Wires"])
+        else:
+            wires_count = 0
+    return _sav_info(
+        sav.get("InternalName"),
+        sav.get("Type"),
+        summary.get("Subject") if isinstance(summary, dict) else None,
+        experiment.get("Components"),
+        elements_count,
+        wires_count,
+    )
+
+
+_SAV_INDEX_VERSION = 2
+
+
+def _get_cache_dir() -> str:
+    """physicsLab自己的缓存目录, 可以通过环境变量`PHYSICSLAB_CACHE_PATH`指定"""
+    if "PHYSICSLAB_CACHE_PATH" in os.environ:
+        return os.environ["PHYSICSLAB_CACHE_PATH"]
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
     else:
+        base = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+    return os.path.join(base, "physicsLab")
+
+
+class _SavIndex:
+    """存档目录的索引: 存档文件名 -> (修改时间, 文件大小, 存档名)
+    索引会被保存在physicsLab的缓存目录中 (而不是物实的存档目录),
+    存档目录的修改时间未变化时 (没有新增, 删除存档) 不会重新扫描目录,
+    扫描时只会重新读取新增或被修改过的存档
+
+    存档被原地修改时目录的修改时间不会变化, 因此索引中的结果可能已经过时,
+    调用者需要检查找到的存档, 找不到时再通过update(force=True)重新扫描
+    """
+
+    __slots__ = ("sav_dir", "_dir_mtime_ns", "_files", "_names")
+
+    def __init__(self, sav_dir: str) -> None:
+        self.sav_dir = sav_dir
+        # 上次扫描时存档目录的st_mtime_ns
+        self._dir_mtime_ns: Optional[int] = None
+        # 文件名 -> [st_mtime_ns, st_size, InternalName]
+        self._files: Dict[str, list] = {}
+        # InternalName -> 文件名
+        self._names: Dict[str, List[str]] = {}
+
+        try:
+            with open(self._path(), encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != _SAV_INDEX_VERSION
+            or index.get("sav_dir") != os.path.abspath(sav_dir)
+            or not isinstance(index.get("savs"), dict)
+        ):
+            return
+        for filename, record in index["savs"].items():
+            if isinstance(record, list) and len(record) == 3:
+                self._add(filename, record)
+        if isinstance(index.get("dir_mtime_ns"), int):
+            self._dir_mtime_ns = index["dir_mtime_ns"]
+
+    def _path(self) -> str:
+        # 不同的存档目录的索引以目录的路径区分
+        digest = hashlib.blake2b(
+            os.path.abspath(self.sav_dir).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return os.path.join(_get_cache_dir(), f"sav_index_{digest}.json")
+
+    def _add(self, filename: str, record: list) -> None:
+        self._files[filename] = record
+        if record[2] is not None:
+            self._names.setdefault(record[2], []).append(filename)
+
+    def _discard(self, filename: str) -> None:
+        record = self._files.pop(filename)
+        if record[2] is not None:
+            filenames = self._names[record[2]]
+            filenames.remove(filename)
+            if len(filenames) == 0:
+                del self._names[record[2]]
+
+    def update(self, force: bool = False) -> None:
+        """根据文件的修改时间与大小增量地更新索引
+
+        Args:
+            force: 存档目录的修改时间未变化时是否仍然扫描目录
+        """
+        # 在扫描之前获取, 扫描期间目录被修改时下次仍会重新扫描
+        dir_mtime_ns = os.stat(self.sav_dir).st_mtime_ns
+        if not force and dir_mtime_ns == self._dir_mtime_ns:
+            return
+
+        changed = dir_mtime_ns != self._dir_mtime_ns
+        self._dir_mtime_ns = dir_mtime_ns
+        filenames = set()
+        with os.scandir(self.sav_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".sav") or not entry.is_file():
+                    continue
+                filenames.add(entry.name)
+                stat = entry.stat()
+                record = self._files.get(entry.name)
+                if (
+                    record is not None
+                    and record[0] == stat.st_mtime_ns
+                    and record[1] == stat.st_size
+                ):
+                    continue
+
+                try:
+                    internal_name = probe_sav(entry.path).internal_name
+                except errors.InvalidSavError:
+                    internal_name = None
+                if record is not None:
+                    self._discard(entry.name)
+                self._add(entry.name, [stat.st_mtime_ns, stat.st_size, internal_name])
+                changed = True
+
+        for filename in self._files.keys() - filenames:
+            self._discard(filename)
+            changed = True
+
+        if changed:
+            self._dump()
+
+    def _dump(self) -> None:
+        path = self._path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": _SAV_INDEX_VERSION,
+                        "sav_dir": os.path.abspath(self.sav_dir),
+                        "dir_mtime_ns": self._dir_mtime_ns,
+                        "savs": self._files,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(path + ".tmp", path)
+        except OSError:  # 索引仅用于加速查找, 写入失败时不影响使用
+            pass
+
+    def find(self, sav_name: str) -> List[str]:
+        """获取存档名为sav_name的存档的文件名 (结果可能已经过时, 见_SavIndex)"""
+        return list(self._names.get(sav_name, ()))
+
+
+# 存档目录 -> 该目录的索引
+_sav_indexes: Dict[str, _SavIndex] = {}
+
+
+def _get_sav_index(force: bool = False) -> _SavIndex:
+    """获取当前存档目录的索引
+
+    Args:
+        force: 存档目录的修改时间未变化时是否仍然重新扫描目录
+    """
+    sav_dir = _Experiment.SAV_PATH_DIR
+    index = _sav_indexes.get(sav_dir)
+    if index is None:
+        index = _sav_indexes[sav_dir] = _SavIndex(sav_dir)
+    index.update(force)
+    return index
+
+
+_SAV_CACHE_VERSION = 1
+
+
+# marshal无法序列化savTemplate.Generate, 缓存中以该tuple代替 (json解析的结果中不会出现tuple)
+_GENERATE_MARK = ("physicsLab.savTemplate.Generate",)
+
+
+def _encode_generate(obj):
+    """将obj中的Generate替换为_GENERATE_MARK (返回替换后的副本)"""
+    if obj is Generate:
+        return _GENERATE_MARK
+    if isinstance(obj, dict):
+        return {key: _encode_generate(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_encode_generate(value) for value in obj]
+    return obj
+
+
+def _decode_generate(obj):
+    """将obj中的_GENERATE_MARK还原为Generate (返回还原后的副本)"""
+    if type(obj) is tuple and obj == _GENERATE_MARK:
+        return Generate
+    if isinstance(obj, dict):
+        return {key: _decode_generate(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_decode_generate(value) for value in obj]
+    return obj
+
+
+class _SavCache:
+    """存档旁的二进制缓存 (存档路径 + `.cache`)
+    以marshal格式保存解析后的存档与StatusSave, 再次读取未被修改的存档时可以跳过json解析
+    缓存通过存档的大小, 修改时间与内容的hash判断是否有效
+    """
+
+    __slots__ = ("sav_path", "_key")
+
+    def __init__(self, sav_path: str) -> None:
+        self.sav_path = sav_path
+
+        stat = os.stat(sav_path)
+        digest = hashlib.blake2b(digest_size=16)
         with open(sav_path, "rb") as f:
-            encoding = chardet.detect(f.read())["encoding"]
-        res = encode_sav(sav_path, encoding)
-        if res is not None:
-            return res
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        # marshal的格式与python版本相关, 因此python版本也是key的一部分
+        self._key = (
+            _SAV_CACHE_VERSION,
+            marshal.version,
+            tuple(sys.version_info[:2]),
+            stat.st_size,
+            stat.st_mtime_ns,
+            digest.digest(),
+        )
 
-    raise errors.InvalidSavError
+    def _path(self) -> str:
+        return self.sav_path + _SAV_CACHE_SUFFIX
+
+    def load(self) -> Optional[Tuple[dict, dict]]:
+        """读取缓存的存档与StatusSave, 缓存不存在或已失效时返回None"""
+        try:
+            with open(self._path(), "rb") as f:
+                (key_size,) = struct.unpack("<I", f.read(4))
+                if marshal.loads(f.read(key_size)) != self._key:
+                    return None
+                # 直接从文件marshal.load会逐个对象地读取文件, 比一次性读入慢得多
+                plsav, status_save = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return None
+        # 存档中的Summary为null时, 读取存档时会以含Generate的模板代替
+        return _decode_generate(plsav), status_save
+
+    def dump(self, plsav: dict, status_save: dict) -> None:
+        # 缓存仅用于加速读取, 写入失败时不影响使用
+        try:
+            key = marshal.dumps(self._key)
+            payload = marshal.dumps((_encode_generate(plsav), status_save))
+        except ValueError:  # 含有marshal无法序列化的对象
+            return
+
+        path = self._path()
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(struct.pack("<I", len(key)))
+                f.write(key)
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _get_nested_keys(data: dict) -> Optional[List[str]]:
+    """获取data中值为dict或list的key
+    若这些值中还嵌套了dict或list, 则无法用 _copy_data 复制, 返回None
+    """
+    res: List[str] = []
+    for key, value in data.items():
+        if isinstance(value, (dict, list)):
+            values = value.values() if isinstance(value, dict) else value
+            if any(isinstance(a_value, (dict, list)) for a_value in values):
+                return None
+            res.append(key)
+    return res
+
+
+def _copy_data(data: dict, nested_keys: List[str]) -> dict:
+    """复制元件的data, 比copy.deepcopy快得多"""
+    res = data.copy()
+    for key in nested_keys:
+        res[key] = data[key].copy()
+    return res
+
+
+def _build_element_registry(module) -> Dict[str, type]:
+    """收集模块中所有元件的类, 以类名为键"""
+    return {
+        name: obj
+        for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, ElementBase)
+    }
+
+
+# 元件的ModelID或类名 -> 元件的类
+# 查找时未命中的ModelID会在规范化后被缓存进来, 因此之后的查找只需要一次字典查询
+_CIRCUIT_ELEMENTS: Dict[str, type] = {
+    **_build_element_registry(circuit),
+    "555_Timer": circuit.NE555,
+    "8bit_Input": circuit.Eight_Bit_Input,
+    "8bit_Display": circuit.Eight_Bit_Display,
+}
+_CELESTIAL_ELEMENTS: Dict[str, type] = _build_element_registry(celestial)
+_ELECTROMAGNETISM_ELEMENTS: Dict[str, type] = _build_element_registry(electromagnetism)
+
+
+def _get_element_class(experiment_type: ExperimentType, name: str) -> type:
+    """通过元件的ModelID或其类名获取元件的类"""
+    if experiment_type == ExperimentType.Circuit:
+        registry = _CIRCUIT_ELEMENTS
+    elif experiment_type == ExperimentType.Celestial:
+        registry = _CELESTIAL_ELEMENTS
+    elif experiment_type == ExperimentType.Electromagnetism:
+        registry = _ELECTROMAGNETISM_ELEMENTS
+    else:
+        errors.unreachable()
+
+    res = registry.get(name)
+    if res is None:
+        res = registry.get(name.strip().replace(" ", "_").replace("-", "_"))
+        if res is None:
+            raise errors.ElementNotFound(f"No such element `{name}`")
+        registry[name] = res
+    return res
+
+
+# 元件的类 -> 该类的构造函数是否只生成了data
+_plain_element_classes: Dict[type, bool] = {}
+
+# 延迟读取时, 在第一次被访问时才会被创建的属性
+_LAZY_ATTRS = (
+    "Elements",
+    "_position2elements",
+    "_element2position",
+    "_id2element",
+    "Wires",
+    "_pin2wires",
+)
 
 
 def search_experiment(sav_name: str) -> Tuple[Optional[str], Optional[dict]]:
@@ -75,34 +744,183 @@ def search_experiment(sav_name: str) -> Tuple[Optional[str], Optional[dict]]:
             f"Parameter sav_name must be of type `str`, but got `{type(sav_name).__name__}`"
         )
 
-    for a_sav in _get_all_pl_sav():
-        try:
-            sav = _open_sav(os.path.join(_Experiment.SAV_PATH_DIR, a_sav))
-        except errors.InvalidSavError:
-            continue
-        if sav.get("InternalName") == sav_name:
-            return a_sav, sav
+    # 索引中的结果可能已经过时 (存档被原地修改), 找不到时再重新扫描存档目录
+    for force in (False, True):
+        for a_sav in _get_sav_index(force).find(sav_name):
+            sav_path = os.path.join(_Experiment.SAV_PATH_DIR, a_sav)
+            if not os.path.isfile(sav_path):
+                continue
+            try:
+                sav = _open_sav(sav_path)
+            except errors.InvalidSavError:
+                continue
+            if sav.get("InternalName") == sav_name:
+                return a_sav, sav
 
     return None, None
 
 
+class SavSummary(NamedTuple):
+    """`load_savs`默认为每个存档返回的统计结果"""
+
+    internal_name: Optional[str]
+    experiment_type: Optional[ExperimentType]
+    subject: Optional[str]
+    # 元件的ModelID -> 该种元件的数量
+    elements: Dict[str, int]
+    wires_count: int
+
+
+def _summarize_sav(plsav: dict, status_save: dict) -> SavSummary:
+    experiment = plsav["Experiment"] if "Experiment" in plsav else plsav
+    summary = plsav.get("Summary")
+    elements = status_save.get("Elements") or []
+    if isinstance(elements, dict):  # 天体物理实验
+        elements = elements.values()
+
+    models: Dict[str, int] = {}
+    for a_element in elements:
+        model = a_element.get("ModelID", a_element.get("Model"))
+        models[model] = models.get(model, 0) + 1
+
+    try:
+        experiment_type = ExperimentType(experiment.get("Type"))
+    except ValueError:
+        experiment_type = None
+    return SavSummary(
+        plsav.get("InternalName"),
+        experiment_type,
+        summary.get("Subject") if isinstance(summary, dict) else None,
+        models,
+        len(status_save.get("Wires") or ()),
+    )
+
+
+class _InvalidSav:
+    """表示子进程读取的文件不是物实存档"""
+
+
+def _load_sav_worker(sav_path: str, func: Callable[[dict, dict], Any]) -> Any:
+    """在子进程中读取并解析存档, 只将func的结果传回主进程"""
+    try:
+        plsav = _open_sav(sav_path)
+        experiment = plsav["Experiment"] if "Experiment" in plsav else plsav
+        status_save = _json.loads(experiment["StatusSave"])
+    except (errors.InvalidSavError, KeyError, TypeError, ValueError):
+        return _InvalidSav
+    return func(plsav, status_save)
+
+
+def load_savs(
+    savs: Union[str, pathlib.Path, Iterable[Union[str, pathlib.Path]]],
+    func: Callable[[dict, dict], Any] = _summarize_sav,
+    *,
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Dict[str, Any]:
+    """使用多进程批量读取存档, 不会创建Experiment, 也不会影响当前打开的实验
+    存档的解码与StatusSave的解析均在子进程中进行, 子进程只会将func的结果传回主进程
+    在Windows上调用该函数时, 需要将调用放在`if __name__ == "__main__":`中
+
+    Args:
+        savs: 存档所在的文件夹, 或存档路径的序列
+        func: 在子进程中对每个存档调用的函数, 参数为存档对应的dict与解析后的StatusSave,
+              必须可以被pickle (如模块中定义的函数), 默认返回SavSummary
+        max_workers: 进程数, 默认为cpu的核心数
+        chunksize: 每次分配给一个进程的存档数
+
+    Returns:
+        存档路径 -> func的结果, 不是物实存档的文件会被忽略
+    """
+    if isinstance(savs, (str, pathlib.Path)):
+        if not os.path.isdir(savs):
+            raise NotADirectoryError(f'"{savs}" is not a directory')
+        with os.scandir(savs) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".sav") and entry.is_file()
+            ]
+    else:
+        paths = [str(a_sav) for a_sav in savs]
+    if not callable(func):
+        raise TypeError(
+            f"Parameter func must be callable, but got value `{func}` of type `{type(func).__name__}`"
+        )
+    if not isinstance(max_workers, (int, type(None))):
+        raise TypeError(
+            f"Parameter max_workers must be of type `Optional[int]`, but got value `{max_workers}` of type `{type(max_workers).__name__}`"
+        )
+    if not isinstance(chunksize, int):
+        raise TypeError(
+            f"Parameter chunksize must be of type `int`, but got value `{chunksize}` of type `{type(chunksize).__name__}`"
+        )
+
+    if max_workers == 1:
+        results = [_load_sav_worker(path, func) for path in paths]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            results = list(
+                executor.map(
+                    _load_sav_worker,
+                    paths,
+                    [func] * len(paths),
+                    chunksize=chunksize,
+                )
+            )
+
+    return {
+        path: result
+        for path, result in zip(paths, results)
+        if result is not _InvalidSav
+    }
+
+
 class Experiment(_Experiment):
     @overload
-    def __init__(self, open_mode: OpenMode, filepath: Union[str, pathlib.Path]) -> None:
+    def __init__(
+        self,
+        open_mode: OpenMode,
+        filepath: Union[str, pathlib.Path],
+        /,
+        *,
+        fast_load: bool = False,
+        lazy: bool = False,
+        columnar: bool = False,
+        cache: bool = False,
+    ) -> None:
         """根据存档对应的文件路径打开存档
 
         Args:
             open_mode = OpenMode.load_by_filepath
             filepath: 存档对应的文件的完整路径
+            fast_load: 跳过元件的构造函数, 直接用存档中元件的dict构造元件, 以加快大型存档的读取
+            lazy: 直到第一次访问元件或导线时才创建元件与导线, 未被访问的元件在保存时会被原样写回
+            columnar: 按列存放电学元件的坐标, 角度等字段, 元件的data仅是对应行的视图, 以减少超大型存档占用的内存
+            cache: 在存档旁以二进制格式缓存解析后的存档, 再次读取未被修改的存档时跳过json解析
         """
 
     @overload
-    def __init__(self, open_mode: OpenMode, sav_name: str) -> None:
+    def __init__(
+        self,
+        open_mode: OpenMode,
+        sav_name: str,
+        /,
+        *,
+        fast_load: bool = False,
+        lazy: bool = False,
+        columnar: bool = False,
+        cache: bool = False,
+    ) -> None:
         """根据存档名打开存档
 
         Args:
             open_mode = OpenMode.load_by_sav_name
             sav_name: 存档的名字
+            fast_load: 跳过元件的构造函数, 直接用存档中元件的dict构造元件, 以加快大型存档的读取
+            lazy: 直到第一次访问元件或导线时才创建元件与导线, 未被访问的元件在保存时会被原样写回
+            columnar: 按列存放电学元件的坐标, 角度等字段, 元件的data仅是对应行的视图, 以减少超大型存档占用的内存
+            cache: 在存档旁以二进制格式缓存解析后的存档, 再次读取未被修改的存档时跳过json解析
         """
 
     @overload
@@ -114,6 +932,9 @@ class Experiment(_Experiment):
         /,
         *,
         user: Optional[User] = None,
+        fast_load: bool = False,
+        lazy: bool = False,
+        columnar: bool = False,
     ) -> None:
         """从物实服务器中获取存档
 
@@ -122,6 +943,9 @@ class Experiment(_Experiment):
             content_id: 物实 实验/讨论 的id
             category: 实验区还是黑洞区
             user: 执行获取实验操作的用户, 若未指定则会创建一个临时匿名用户执行该操作 (会导致程序变慢)
+            fast_load: 跳过元件的构造函数, 直接用存档中元件的dict构造元件, 以加快大型存档的读取
+            lazy: 直到第一次访问元件或导线时才创建元件与导线, 未被访问的元件在保存时会被原样写回
+            columnar: 按列存放电学元件的坐标, 角度等字段, 元件的data仅是对应行的视图, 以减少超大型存档占用的内存
         """
 
     @overload
@@ -152,26 +976,69 @@ class Experiment(_Experiment):
         self.open_mode: OpenMode = open_mode
         # 通过坐标索引元件
         self._position2elements = {}
+        # 元件当前所在的坐标, 使移动与删除元件时无需遍历_position2elements
+        self._element2position = {}
         # 通过元件的Identifier索引元件
         self._id2element = {}
         # 通过index（元件生成顺序）索引元件
-        self.Elements = []
+        self.Elements = _ElementList()
+
+        fast_load = kwargs.pop("fast_load", False)
+        if not isinstance(fast_load, bool):
+            raise TypeError(
+                f"Parameter fast_load must be of type `bool`, but got value `{fast_load}` of type `{type(fast_load).__name__}`"
+            )
+        lazy = kwargs.pop("lazy", False)
+        if not isinstance(lazy, bool):
+            raise TypeError(
+                f"Parameter lazy must be of type `bool`, but got value `{lazy}` of type `{type(lazy).__name__}`"
+            )
+        columnar = kwargs.pop("columnar", False)
+        if not isinstance(columnar, bool):
+            raise TypeError(
+                f"Parameter columnar must be of type `bool`, but got value `{columnar}` of type `{type(columnar).__name__}`"
+            )
+        if (fast_load or lazy or columnar) and open_mode == OpenMode.crt:
+            raise TypeError(
+                "fast_load, lazy and columnar are only supported when loading an experiment"
+            )
+        cache = kwargs.pop("cache", False)
+        if not isinstance(cache, bool):
+            raise TypeError(
+                f"Parameter cache must be of type `bool`, but got value `{cache}` of type `{type(cache).__name__}`"
+            )
+        if cache and open_mode not in (
+            OpenMode.load_by_filepath,
+            OpenMode.load_by_sav_name,
+        ):
+            raise TypeError("cache is only supported when loading a local experiment")
+        # 是否以_ElementColumns存放读取的电学元件
+        self._columnar = columnar
+        # 从缓存中读取的StatusSave
+        status_sav: Optional[dict] = None
+        sav_cache: Optional[_SavCache] = None
+        # 延迟读取时, 存档中尚未被实例化的元件与导线的dict
+        self._lazy_elements: Optional[list] = None
+        self._lazy_wires: Optional[list] = None
+        # 延迟读取时, 已通过get_element_from_identifier单独实例化的元件
+        self._lazy_built: Dict[str, ElementBase] = {}
+        self._lazy_id2element: Optional[Dict[str, dict]] = None
 
         # 尽管读取存档时会将元件的字符串一并读入, 但只有在调用 load_elements 将元件的信息
         # 导入self.Elements与self._element_position之后, 元件信息才被完全导入
         if open_mode == OpenMode.load_by_filepath:
             if len(kwargs) == 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
                 )
             elif len(kwargs) != 0:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
                 )
 
             if len(args) != 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path) -> None`, but got {len(args)} positional arguments"
+                    f"When open_mode is OpenMode.load_by_filepath, constructor is `def __init__(self, open_mode: OpenMode, filepath: str | pathlib.Path, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but got {len(args)} positional arguments"
                 )
             sav_name = args[0]
             if not isinstance(sav_name, (str, pathlib.Path)):
@@ -188,36 +1055,43 @@ class Experiment(_Experiment):
             if _ExperimentStack.inside(self):
                 raise errors.ExperimentOpenedError
 
-            _temp = _open_sav(self.SAV_PATH)
-
-            if "Experiment" in _temp.keys():
-                self.PlSav = _temp
-            else:  # 读取物实导出的存档只含有.sav的Experiment部分
-                if _temp["Type"] == ExperimentType.Circuit.value:
-                    self.PlSav = copy.deepcopy(savTemplate.Circuit)
-                elif _temp["Type"] == ExperimentType.Celestial.value:
-                    self.PlSav = copy.deepcopy(savTemplate.Celestial)
-                elif _temp["Type"] == ExperimentType.Electromagnetism.value:
-                    self.PlSav = copy.deepcopy(savTemplate.Electromagnetism)
-                else:
-                    errors.unreachable()
-
-                self.PlSav["Experiment"] = _temp
-                # .sav的Experiment不包含存档名, 会产生一个匿名存档
+            if cache:
+                sav_cache = _SavCache(self.SAV_PATH)
+                cached = sav_cache.load()
+                if cached is not None:
+                    self.PlSav, status_sav = cached
+
+            if status_sav is None:
+                _temp = _open_sav(self.SAV_PATH)
+
+                if "Experiment" in _temp.keys():
+                    self.PlSav = _temp
+                else:  # 读取物实导出的存档只含有.sav的Experiment部分
+                    if _temp["Type"] == ExperimentType.Circuit.value:
+                        self.PlSav = copy.deepcopy(savTemplate.Circuit)
+                    elif _temp["Type"] == ExperimentType.Celestial.value:
+                        self.PlSav = copy.deepcopy(savTemplate.Celestial)
+                    elif _temp["Type"] == ExperimentType.Electromagnetism.value:
+                        self.PlSav = copy.deepcopy(savTemplate.Electromagnetism)
+                    else:
+                        errors.unreachable()
+
+                    self.PlSav["Experiment"] = _temp
+                    # .sav的Experiment不包含存档名, 会产生一个匿名存档
             self.__load()
         elif open_mode == OpenMode.load_by_sav_name:
             if len(kwargs) == 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but an unexpected keyword argument is gotten: {list(kwargs.keys())[0]}={list(kwargs.values())[0]}"
                 )
             elif len(kwargs) != 0:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but unexpected keyword arguments are gotten: {''.join(str(key) + '=' + str(value) + ' ' for key, value in kwargs.items())}"
                 )
 
             if len(args) != 1:
                 raise TypeError(
-                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str) -> None`, but got {len(args)} positional arguments"
+                    f"When open_mode is OpenMode.load_by_sav_name, constructor is `def __init__(self, open_mode: OpenMode, sav_name: str, /, *, fast_load: bool = False, lazy: bool = False, columnar: bool = False, cache: bool = False) -> None`, but got {len(args)} positional arguments"
                 )
             sav_name = args[0]
             if not isinstance(sav_name, str):
@@ -225,16 +1099,34 @@ class Experiment(_Experiment):
                     f"sav_name must be of type `str`, but got `{type(sav_name).__name__}`"
                 )
 
-            filename, _plsav = search_experiment(sav_name)
+            filename: Optional[str] = None
+            if cache:
+                # 先尝试读取缓存, 以免为了检查存档名而解析整个存档
+                for a_sav in _get_sav_index().find(sav_name):
+                    sav_cache = _SavCache(os.path.join(_Experiment.SAV_PATH_DIR, a_sav))
+                    cached = sav_cache.load()
+                    if cached is not None and cached[0].get("InternalName") == sav_name:
+                        filename = a_sav
+                        self.PlSav, status_sav = cached
+                        break
+
             if filename is None:
-                raise errors.ExperimentNotExistError(f'No such experiment "{sav_name}"')
+                filename, _plsav = search_experiment(sav_name)
+                if filename is None:
+                    raise errors.ExperimentNotExistError(
+                        f'No such experiment "{sav_name}"'
+                    )
+                assert _plsav is not None
+                self.PlSav = _plsav
+                if cache:
+                    sav_cache = _SavCache(
+                        os.path.join(_Experiment.SAV_PATH_DIR, filename)
+                    )
 
             self.SAV_PATH = os.path.join(_Experiment.SAV_PATH_DIR, filename)
             if _ExperimentStack.inside(self):
                 raise errors.ExperimentOpenedError
 
-            assert _plsav is not None
-            self.PlSav = _plsav
             self.__load()
         elif open_mode == OpenMode.load_by_plar_app:
             content_id, category, *rest = args
@@ -342,6 +1234,8 @@ class Experiment(_Experiment):
                 self._is_elementXYZ: bool = False
                 self.PlSav: dict = copy.deepcopy(savTemplate.Circuit)
                 self.Wires: set = set()  # Set[Wire] # 存档对应的导线
+                # 通过元件与引脚的label索引引脚上连接的导线
+                self._pin2wires: dict = {}
                 # 存档对应的StatusSave, 存放实验元件，导线（如果是电学实验的话）
                 self.CameraSave: dict = {
                     "Mode": 0,
@@ -384,7 +1278,7 @@ class Experiment(_Experiment):
         assert isinstance(self.open_mode, OpenMode)
         assert isinstance(self._position2elements, dict)
         assert isinstance(self._id2element, dict)
-        assert isinstance(self.Elements, list)
+        assert isinstance(self.Elements, _ElementList)
         assert isinstance(self.SAV_PATH, str)
         assert isinstance(self.PlSav, dict)
         assert isinstance(self.CameraSave, dict)
@@ -393,6 +1287,7 @@ class Experiment(_Experiment):
         assert isinstance(self.experiment_type, ExperimentType)
         if self.experiment_type == ExperimentType.Circuit:
             assert isinstance(self.Wires, set)
+            assert isinstance(self._pin2wires, dict)
             assert isinstance(self._is_elementXYZ, bool)
             assert isinstance(self._elementXYZ_origin_position, _tools.position)
 
@@ -403,28 +1298,45 @@ class Experiment(_Experiment):
             or self.open_mode == OpenMode.load_by_filepath
             or self.open_mode == OpenMode.load_by_plar_app
         ):
-            status_sav = json.loads(self.PlSav["Experiment"]["StatusSave"])
-
-            if self.experiment_type == ExperimentType.Circuit:
-                self.__load_elements(status_sav["Elements"])
+            if status_sav is None:
+                status_sav = _json.loads(self.PlSav["Experiment"]["StatusSave"])
+                if sav_cache is not None:
+                    # 读取元件时可能会修改status_sav中的dict, 因此在此之前写入缓存
+                    sav_cache.dump(self.PlSav, status_sav)
+
+            if lazy:
+                if self.experiment_type == ExperimentType.Celestial:
+                    self._lazy_elements = list(status_sav["Elements"].values())
+                else:
+                    self._lazy_elements = status_sav["Elements"]
+                if self.experiment_type == ExperimentType.Circuit:
+                    self._lazy_wires = status_sav["Wires"]
+                # 元件与导线的容器会在第一次被访问时由 __getattr__ 创建
+                for name in _LAZY_ATTRS:
+                    self.__dict__.pop(name, None)
+            elif self.experiment_type == ExperimentType.Circuit:
+                self.__load_elements(
+                    status_sav["Elements"], fast_load, columnar=columnar
+                )
                 self.__load_wires(status_sav["Wires"])
             elif self.experiment_type == ExperimentType.Celestial:
-                self.__load_elements(list(status_sav["Elements"].values()))
+                self.__load_elements(list(status_sav["Elements"].values()), fast_load)
             elif self.experiment_type == ExperimentType.Electromagnetism:
-                self.__load_elements(status_sav["Elements"])
+                self.__load_elements(status_sav["Elements"], fast_load)
             else:
                 errors.unreachable()
 
     def __load(self) -> None:
         assert isinstance(self.PlSav["Experiment"]["CameraSave"], str)
         self.CameraSave = json.loads(self.PlSav["Experiment"]["CameraSave"])
-        temp = eval(f"({self.CameraSave['VisionCenter']})")
+        vision_center, target_rotation = _tools.parse_vectors(
+            [self.CameraSave["VisionCenter"], self.CameraSave["TargetRotation"]]
+        )
         self.VisionCenter: _tools.position = _tools.position(
-            temp[0], temp[2], temp[1]
+            vision_center[0], vision_center[2], vision_center[1]
         )  # x, z, y
-        temp = eval(f"({self.CameraSave['TargetRotation']})")
         self.TargetRotation: _tools.position = _tools.position(
-            temp[0], temp[2], temp[1]
+            target_rotation[0], target_rotation[2], target_rotation[1]
         )  # x, z, y
 
         if self.PlSav["Summary"] is None:
@@ -435,6 +1347,8 @@ class Experiment(_Experiment):
             # 是否将该实验在全局范围中设置为元件坐标系
             self._is_elementXYZ: bool = False
             self.Wires: set = set()  # Set[Wire] # 存档对应的导线
+            # 通过元件与引脚的label索引引脚上连接的导线
+            self._pin2wires: dict = {}
         elif self.PlSav["Experiment"]["Type"] == ExperimentType.Celestial.value:
             self.experiment_type = ExperimentType.Celestial
         elif self.PlSav["Experiment"]["Type"] == ExperimentType.Electromagnetism.value:
@@ -459,75 +1373,331 @@ class Experiment(_Experiment):
             else:
                 errors.unreachable()
 
-            crt_wire(
-                Pin(
-                    self.get_element_from_identifier(wire_dict["Source"]),
-                    wire_dict["SourcePin"],
-                ),
-                Pin(
-                    self.get_element_from_identifier(wire_dict["Target"]),
-                    wire_dict["TargetPin"],
-                ),
-                color=color,
+            self._add_wire(
+                Wire(
+                    Pin(
+                        self.get_element_from_identifier(wire_dict["Source"]),
+                        wire_dict["SourcePin"],
+                    ),
+                    Pin(
+                        self.get_element_from_identifier(wire_dict["Target"]),
+                        wire_dict["TargetPin"],
+                    ),
+                    color=color,
+                )
             )
 
-    def __load_elements(self, _elements: list) -> None:
+    def __load_elements(
+        self,
+        _elements: list,
+        fast_load: bool = False,
+        built: Optional[Dict[str, ElementBase]] = None,
+        columnar: bool = False,
+    ) -> None:
         assert isinstance(_elements, list)
 
-        for element in _elements:
-            # Unity 采用左手坐标系
-            x, z, y = eval(f"({element['Position']})")
+        if columnar:
+            self.__load_columnar_elements(_elements, built)
+            return
 
-            # 实例化对象
-            if self.experiment_type == ExperimentType.Circuit:
-                if element["ModelID"] == "Simple Instrument":
-                    from .circuit.elements.otherCircuit import Simple_Instrument
-
-                    pitches = []
-                    for attr, val in element["Properties"].items():
-                        if attr.startswith("音高"):
-                            pitches.append(int(val))
-
-                    obj = Simple_Instrument(
-                        x,
-                        y,
-                        z,
-                        pitches=pitches,
-                        identifier=element["Identifier"],
-                        elementXYZ=False,
-                        instrument=int(element["Properties"].get("乐器", 0)),
-                        volume=element["Properties"]["音量"],
-                        rated_oltage=element["Properties"]["额定电压"],
-                        is_ideal=bool(element["Properties"]["理想模式"]),
-                        is_pulse=bool(element["Properties"]["脉冲"]),
-                    )
-                else:
-                    obj = self.crt_element(
-                        element["ModelID"],
-                        x,
-                        y,
-                        z,
-                        elementXYZ=False,
-                        identifier=element["Identifier"],
-                    )
-                    obj.data["Properties"] = element["Properties"]
-                # 设置角度信息
-                rotation = eval(f'({element["Rotation"]})')
-                r_x, r_y, r_z = rotation[0], rotation[2], rotation[1]
-                obj.set_rotation(r_x, r_y, r_z)
+        # 一次性解析所有元件的坐标 (Unity 采用左手坐标系)
+        positions = _tools.parse_vectors([element["Position"] for element in _elements])
+        if fast_load:
+            self.__fast_load_elements(_elements, positions, built)
+            return
 
-            elif self.experiment_type == ExperimentType.Celestial:
-                obj = self.crt_element(
-                    element["Model"], x, y, z, identifier=element["Identifier"]
+        if self.experiment_type == ExperimentType.Circuit:
+            rotations = _tools.parse_vectors(
+                [element["Rotation"] for element in _elements]
+            )
+        else:
+            rotations = [None] * len(_elements)  # 非电学实验不读取角度
+
+        for element, (x, z, y), rotation in zip(_elements, positions, rotations):
+            self.__load_element(element, x, y, z, rotation)
+
+    def __load_element(
+        self,
+        element: dict,
+        x: num_type,
+        y: num_type,
+        z: num_type,
+        rotation: Optional[Tuple[num_type, num_type, num_type]],
+    ) -> None:
+        """通过元件的构造函数读取一个元件"""
+        if self.experiment_type == ExperimentType.Circuit:
+            if element["ModelID"] == "Simple Instrument":
+                from .circuit.elements.otherCircuit import Simple_Instrument
+
+                pitches = []
+                for attr, val in element["Properties"].items():
+                    if attr.startswith("音高"):
+                        pitches.append(int(val))
+
+                obj = Simple_Instrument(
+                    x,
+                    y,
+                    z,
+                    pitches=pitches,
+                    identifier=element["Identifier"],
+                    experiment=self,
+                    elementXYZ=False,
+                    instrument=int(element["Properties"].get("乐器", 0)),
+                    volume=element["Properties"]["音量"],
+                    rated_oltage=element["Properties"]["额定电压"],
+                    is_ideal=bool(element["Properties"]["理想模式"]),
+                    is_pulse=bool(element["Properties"]["脉冲"]),
                 )
-                obj.data = element
-            elif self.experiment_type == ExperimentType.Electromagnetism:
-                obj = self.crt_element(
-                    element["ModelID"], x, y, z, identifier=element["Identifier"]
+            else:
+                obj = _get_element_class(self.experiment_type, element["ModelID"])(
+                    x,
+                    y,
+                    z,
+                    elementXYZ=False,
+                    identifier=element["Identifier"],
+                    experiment=self,
+                )
+                obj.data["Properties"] = element["Properties"]
+            # 设置角度信息
+            r_x, r_y, r_z = rotation[0], rotation[2], rotation[1]
+            obj.set_rotation(r_x, r_y, r_z)
+
+        elif self.experiment_type == ExperimentType.Celestial:
+            obj = _get_element_class(self.experiment_type, element["Model"])(
+                x, y, z, identifier=element["Identifier"], experiment=self
+            )
+            obj.data = element
+        elif self.experiment_type == ExperimentType.Electromagnetism:
+            obj = _get_element_class(self.experiment_type, element["ModelID"])(
+                x, y, z, identifier=element["Identifier"], experiment=self
+            )
+            obj.data = element
+        else:
+            errors.unreachable()
+
+    def __fast_load_elements(
+        self,
+        _elements: list,
+        positions: list,
+        built: Optional[Dict[str, ElementBase]] = None,
+    ) -> None:
+        """直接以存档中元件的dict作为元件的data, 而不调用元件的构造函数
+        不会生成元件的data模板, 也不会重新格式化元件的坐标与角度, 保存时这些字符串会被原样写回
+        构造函数中除了data之外还设置了其他属性的元件, 仍会通过构造函数读取
+
+        Args:
+            built: 已经实例化, 但还未加入实验的元件 (Identifier -> 元件)
+        """
+        for element, (x, z, y) in zip(_elements, positions):
+            obj = None if built is None else built.get(element["Identifier"])
+            if obj is None:
+                cls = self.__get_loaded_element_class(element)
+                if not self.__is_plain_element(cls):
+                    if self.experiment_type == ExperimentType.Circuit:
+                        rotation = _tools.parse_vectors([element["Rotation"]])[0]
+                    else:
+                        rotation = None
+                    self.__load_element(element, x, y, z, rotation)
+                    continue
+                obj = self.__build_plain_element(cls, element, x, y, z)
+
+            self.Elements.append(obj)
+            self._add_to_position_index(obj)
+            self._id2element[element["Identifier"]] = obj
+
+    def __load_columnar_elements(
+        self,
+        _elements: list,
+        built: Optional[Dict[str, ElementBase]] = None,
+    ) -> None:
+        """将电学元件存放在_ElementColumns中, 元件的data为其对应的行
+        构造函数中除了data之外还设置了其他属性的元件, 仍会通过构造函数读取
+
+        Args:
+            built: 已经实例化, 但还未加入实验的元件 (Identifier -> 元件)
+        """
+        assert self.experiment_type == ExperimentType.Circuit
+
+        classes = [self.__get_loaded_element_class(element) for element in _elements]
+        # 需要通过构造函数读取的元件与已实例化的元件不放入列中
+        in_columns = [
+            (built is None or element["Identifier"] not in built)
+            and self.__is_plain_element(cls)
+            for element, cls in zip(_elements, classes)
+        ]
+        columns = _ElementColumns()
+        rows = iter(
+            columns.extend(
+                [element for element, flag in zip(_elements, in_columns) if flag]
+            )
+        )
+
+        for element, cls, flag in zip(_elements, classes, in_columns):
+            if flag:
+                row = next(rows)
+                obj = self.__build_plain_element(
+                    cls, _ElementRow(columns, row), *columns.get_position(row)
                 )
-                obj.data = element
+            elif built is not None and element["Identifier"] in built:
+                obj = built[element["Identifier"]]
             else:
-                errors.unreachable()
+                x, z, y = _tools.parse_vectors([element["Position"]])[0]
+                rotation = _tools.parse_vectors([element["Rotation"]])[0]
+                self.__load_element(element, x, y, z, rotation)
+                continue
+
+            self.Elements.append(obj)
+            self._add_to_position_index(obj)
+            self._id2element[obj.data["Identifier"]] = obj
+
+    def __get_loaded_element_class(self, element: dict) -> type:
+        """获取存档中的元件对应的类"""
+        if self.experiment_type == ExperimentType.Celestial:
+            return _get_element_class(self.experiment_type, element["Model"])
+        return _get_element_class(self.experiment_type, element["ModelID"])
+
+    def __build_plain_element(
+        self,
+        cls: type,
+        element: Union[dict, _ElementRow],
+        x: num_type,
+        y: num_type,
+        z: num_type,
+    ) -> ElementBase:
+        """以element为data实例化元件, 但不将其加入实验"""
+        obj = cls.__new__(cls)
+        obj.experiment = self
+        obj.data = element
+        obj._position = _tools.position(round(x, 6), round(y, 6), round(z, 6))
+        if self.experiment_type == ExperimentType.Circuit:
+            obj.is_elementXYZ = False
+        return obj
+
+    def __is_plain_element(self, cls: type) -> bool:
+        """元件的构造函数是否只生成了data"""
+        res = _plain_element_classes.get(cls)
+        if res is not None:
+            return res
+
+        obj = cls.__new__(cls)
+        obj.experiment = self
+        try:
+            obj.__init__(0, 0, 0)
+        except Exception:  # 构造函数需要额外的参数
+            res = False
+        else:
+            res = obj.__dict__.keys() == {"experiment", "_data"}
+        _plain_element_classes[cls] = res
+        return res
+
+    def __getattr__(self, name: str):
+        # 仅在正常的属性查找失败时才会被调用
+        if name in _LAZY_ATTRS and self.__dict__.get("_lazy_elements") is not None:
+            self.__materialize()
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __materialize(self) -> None:
+        """实例化延迟读取的所有元件与导线"""
+        _elements, _wires, built = (
+            self._lazy_elements,
+            self._lazy_wires,
+            self._lazy_built,
+        )
+        self._lazy_elements = self._lazy_wires = self._lazy_id2element = None
+        self._lazy_built = {}
+
+        self._position2elements = {}
+        self._element2position = {}
+        self._id2element = {}
+        self.Elements = _ElementList()
+        if self.experiment_type == ExperimentType.Circuit:
+            self.Wires = set()
+            self._pin2wires = {}
+
+        self.__load_elements(
+            _elements,
+            fast_load=True,
+            built=built,
+            columnar=self._columnar and self.experiment_type == ExperimentType.Circuit,
+        )
+        if self.experiment_type == ExperimentType.Circuit:
+            assert _wires is not None
+            self.__load_wires(_wires)
+
+    @override
+    def _iter_elements_json(
+        self, encode: Callable[[dict], str], incremental: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        if self._lazy_elements is not None:
+            # 单独实例化的元件的data就是存档中的dict, 因此直接写回即可
+            return (
+                (element["Identifier"], encode(element))
+                for element in self._lazy_elements
+            )
+        return super()._iter_elements_json(encode, incremental)
+
+    @override
+    def _iter_wires_data(self) -> Iterable[dict]:
+        if self._lazy_wires is not None:
+            return iter(self._lazy_wires)
+        return super()._iter_wires_data()
+
+    @_check_not_closed
+    @override
+    def get_elements_count(self) -> int:
+        if self._lazy_elements is not None:
+            return len(self._lazy_elements)
+        return super().get_elements_count()
+
+    @_check_not_closed
+    @override
+    def get_wires_count(self) -> int:
+        if self._lazy_wires is not None:
+            return len(self._lazy_wires)
+        return super().get_wires_count()
+
+    @_check_not_closed
+    def get_netlist(self) -> "circuit.Netlist":
+        """获取电路的网表 (以引脚为节点, 导线为边的无向图)
+        网表只会在第一次调用时建立, 之后连接或删除导线时会同步更新
+        """
+        if self.experiment_type != ExperimentType.Circuit:
+            raise errors.ExperimentTypeError
+
+        if self._netlist is None:
+            self._netlist = circuit.Netlist(self.Wires)
+        return self._netlist
+
+    @_check_not_closed
+    @override
+    def get_element_from_identifier(self, identifier: str) -> ElementBase:
+        if self._lazy_elements is None:
+            return super().get_element_from_identifier(identifier)
+
+        # 延迟读取时只实例化这一个元件
+        obj = self._lazy_built.get(identifier)
+        if obj is not None:
+            return obj
+        if self._lazy_id2element is None:
+            self._lazy_id2element = {
+                element["Identifier"]: element for element in self._lazy_elements
+            }
+        element = self._lazy_id2element.get(identifier)
+        if element is None:
+            raise errors.ElementNotFound
+
+        cls = self.__get_loaded_element_class(element)
+        if not self.__is_plain_element(cls):
+            self.__materialize()
+            return super().get_element_from_identifier(identifier)
+        x, z, y = _tools.parse_vectors([element["Position"]])[0]
+        obj = self._lazy_built[identifier] = self.__build_plain_element(
+            cls, element, x, y, z
+        )
+        return obj
 
     @_check_not_closed
     def crt_element(
@@ -557,21 +1727,127 @@ class Experiment(_Experiment):
                 f"Parameter 'z' must be of type `int | float`, but got value `{z}` of type `{type(z).__name__}`"
             )
 
-        name = name.strip().replace(" ", "_").replace("-", "_")
         x, y, z = _tools.round_data(x), _tools.round_data(y), _tools.round_data(z)
 
-        if self.experiment_type == ExperimentType.Circuit:
-            if name == "555_Timer":
-                return circuit.NE555(x, y, z, **kwargs)
-            elif name == "8bit_Input":
-                return circuit.Eight_Bit_Input(x, y, z, **kwargs)
-            elif name == "8bit_Display":
-                return circuit.Eight_Bit_Display(x, y, z, **kwargs)
-            else:
-                return eval(f"circuit.{name}({x}, {y}, {z}, **{kwargs})")
-        elif self.experiment_type == ExperimentType.Celestial:
-            return eval(f"celestial.{name}({x}, {y}, {z}, **{kwargs})")
-        elif self.experiment_type == ExperimentType.Electromagnetism:
-            return eval(f"electromagnetism.{name}({x}, {y}, {z}, **{kwargs})")
+        return _get_element_class(self.experiment_type, name)(x, y, z, **kwargs)
+
+    @_check_not_closed
+    def crt_elements(
+        self,
+        model: Union[str, type],
+        positions: Iterable[Tuple[num_type, num_type, num_type]],
+        /,
+        *,
+        elementXYZ: Optional[bool] = None,
+        **kwargs,
+    ) -> List[ElementBase]:
+        """批量创建同一种元件
+        参数只会被检查一次, 元件的Identifier也会被一次性生成,
+        因此比逐个调用元件的构造函数快得多
+
+        Args:
+            model: 元件的ModelID, 类名或元件的类
+            positions: 每个元件的坐标 (x, y, z), 也可以是形状为(n, 3)的numpy数组
+            elementXYZ: 是否使用元件坐标系 (仅对电学实验有效)
+            kwargs: 传给每个元件的构造函数的参数
+        """
+        if isinstance(model, str):
+            cls = _get_element_class(self.experiment_type, model)
+        elif isinstance(model, type) and issubclass(model, ElementBase):
+            cls = model
         else:
-            errors.unreachable()
+            raise TypeError(
+                f"Parameter model must be of type `str | type[ElementBase]`, but got value `{model}` of type `{type(model).__name__}`"
+            )
+        if not isinstance(elementXYZ, (bool, type(None))):
+            raise TypeError(
+                f"Parameter elementXYZ must be of type `Optional[bool]`, but got value `{elementXYZ}` of type `{type(elementXYZ).__name__}`"
+            )
+        if "identifier" in kwargs or "experiment" in kwargs:
+            raise TypeError(
+                "crt_elements() can't accept keyword argument `identifier` or `experiment`"
+            )
+        if hasattr(positions, "tolist"):  # numpy.ndarray
+            positions = positions.tolist()
+        positions = [tuple(a_position) for a_position in positions]
+        for a_position in positions:
+            if len(a_position) != 3 or not all(
+                isinstance(num, (int, float)) for num in a_position
+            ):
+                raise TypeError(
+                    f"Parameter positions must be a sequence of `(x, y, z)`, but got value `{a_position}`"
+                )
+
+        identifiers = _tools.randStrings(len(positions), 33)
+
+        if self.experiment_type != ExperimentType.Circuit:
+            if elementXYZ is not None:
+                raise errors.ExperimentTypeError
+            return [
+                cls(x, y, z, identifier=identifier, experiment=self, **kwargs)
+                for (x, y, z), identifier in zip(positions, identifiers)
+            ]
+
+        if not issubclass(cls, circuit.CircuitBase):
+            raise errors.ExperimentTypeError(
+                f"Can't create {cls.__name__} because experiment_type is {self.experiment_type}"
+            )
+
+        is_elementXYZ: bool = elementXYZ is True or (
+            elementXYZ is None and self._is_elementXYZ
+        )
+        return self.__crt_circuit_elements(
+            cls, positions, identifiers, is_elementXYZ, kwargs
+        )
+
+    def __crt_circuit_elements(
+        self,
+        cls: type,
+        positions: List[Tuple[num_type, num_type, num_type]],
+        identifiers: List[str],
+        is_elementXYZ: bool,
+        kwargs: dict,
+    ) -> List[ElementBase]:
+        """crt_elements 对电学元件的实现, 要求参数已被检查过"""
+        # 同一批元件的构造参数相同, 若构造函数只生成了data, 则后续元件直接复制data
+        prototype_data: Optional[dict] = None
+        nested_keys: List[str] = []
+        res: List[ElementBase] = []
+        for (x, y, z), identifier in zip(positions, identifiers):
+            # 坐标已检查过类型, 因此直接调用round而不是_tools.round_data
+            x, y, z = round(x, 6), round(y, 6), round(z, 6)
+
+            obj = cls.__new__(cls)
+            obj.experiment = self
+            if prototype_data is not None:
+                obj.data = _copy_data(prototype_data, nested_keys)
+            else:
+                obj.__init__(x, y, z, **kwargs)
+                if len(res) == 0 and obj.__dict__.keys() == {"experiment", "_data"}:
+                    _nested_keys = _get_nested_keys(obj.data)
+                    if _nested_keys is not None:
+                        nested_keys = _nested_keys
+                        prototype_data = _copy_data(obj.data, nested_keys)
+
+            obj.data["Identifier"] = identifier
+            obj._position = _tools.position(x, y, z)
+            obj.is_elementXYZ = is_elementXYZ
+            if is_elementXYZ:
+                x, y, z = elementXYZ_to_native(
+                    x,
+                    y,
+                    z,
+                    self._elementXYZ_origin_position,
+                    is_bigElement=cls.is_bigElement,
+                )
+                x, y, z = round(x, 6), round(y, 6), round(z, 6)
+            obj.data["Position"] = f"{x},{z},{y}"
+            # 与 CircuitBase.set_rotation() 的默认值一致
+            obj.data["Rotation"] = "0,180,0"
+
+            self.Elements.append(obj)
+            self._add_to_position_index(obj)
+            self._id2element[identifier] = obj
+            res.append(obj)
+
+        return res
@@ -13,6 +13,7 @@ class CircuitExperiment(_Experiment):
     """Experimental support for circuit experiment"""
 
     Wires: set
+    _pin2wires: Dict[CircuitBase, Dict[int, set]]
     _is_elementXYZ: bool
     _elementXYZ_origin_position: _tools.position
 
@@ -46,7 +47,10 @@ class CircuitExperiment(_Experiment):
             TargetRotation,
             ExperimentType.Circuit,
         )
-        self.Wires = wires
+        self.Wires = set()
+        self._pin2wires = {}
+        for a_wire in wires:
+            self._add_wire(a_wire)
         self._is_elementXYZ = is_elementXYZ
         self._elementXYZ_origin_position = elementXYZ_origin_position
 
@@ -4,7 +4,7 @@ from typing import Union, Callable, Tuple
 from physicsLab import _warn
 from physicsLab import errors
 from physicsLab.enums import WireColor
-from physicsLab.circuit._circuit_core import crt_wire, del_wire, Pin
+from physicsLab.circuit._circuit_core import crt_wires_between, del_wire, Pin
 from physicsLab._typing import overload
 
 
@@ -81,8 +81,8 @@ def crt_wires(
     assert isinstance(source_pin, UnitPin) and isinstance(
         target_pin, UnitPin
     ), errors.BUG_REPORT
-    for i, o in zip(source_pin.pins, target_pin.pins):
-        crt_wire(i, o, color=color)
+    length = min(len(source_pin.pins), len(target_pin.pins))
+    crt_wires_between(source_pin.pins[:length], target_pin.pins[:length], color=color)
 
 
 @_check_union_pin_type
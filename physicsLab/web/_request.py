@@ -2,6 +2,7 @@
 
 import json
 import urllib.request
+from physicsLab import _json
 from physicsLab import errors
 from physicsLab._typing import Optional, Union
 
@@ -106,7 +107,7 @@ def post_http(
             content = gzip.decompress(response.read())
         else:
             content = response.read()
-        return json.loads(content)
+        return _json.loads(content)
 
 
 def post_https(
@@ -162,4 +163,4 @@ def post_https(
             content = gzip.decompress(response.read())
         else:
             content = response.read()
-        return json.loads(content)
+        return _json.loads(content)
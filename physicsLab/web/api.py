@@ -12,6 +12,7 @@ import contextvars
 import requests
 
 from physicsLab import plAR
+from physicsLab import _json
 from physicsLab import enums
 from physicsLab import errors
 from physicsLab.enums import Tag, Category
@@ -60,7 +61,7 @@ def _check_response(
 
     response.raise_for_status()
 
-    response_json = response.json()
+    response_json = _json.loads(response.content)
     status_code = response_json["Status"]
 
     if status_code == 200:
@@ -836,7 +837,7 @@ class User:
                 raise PermissionError("login failed")
             if status_code == 404:
                 raise errors.ResponseFail(
-                    response.json()["code"],
+                    _json.loads(response.content)["code"],
                     "experiment not found(may be you select category wrong)",
                 )
 
@@ -1113,13 +1114,14 @@ class User:
                 files=data,
             )
             response.raise_for_status()
-            if response.json()["code"] != 200:
+            response_json = _json.loads(response.content)
+            if response_json["code"] != 200:
                 raise errors.ResponseFail(
-                    response.json()["code"],
-                    f"Physics-Lab-AR returned error code {response.json()['code']} : "
-                    f"{response.json()['message']}`",
+                    response_json["code"],
+                    f"Physics-Lab-AR returned error code {response_json['code']} : "
+                    f"{response_json['message']}`",
                 )
-            return response.json()
+            return response_json
 
     async def async_upload_image(
         self, policy: str, authorization: str, image_path: str
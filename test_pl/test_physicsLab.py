@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 import os
+import copy
+import json
 import sys
 import pathlib
 import warnings
+import random
+import shutil
 import threading
 from .base import *
 from physicsLab.lib import *
-from physicsLab._tools import position
-from physicsLab._core import _ExperimentStack
+from physicsLab._tools import position, parse_vectors, randStrings
+from physicsLab._core import _ExperimentStack, _ElementList
+from physicsLab.element import _get_sav_index
 
 def my_test_dec(method: Callable):
     def result(*args, **kwarg):
@@ -285,6 +290,43 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(len(expe.get_element_from_position(0, 0, 0)), 2)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_position_index(self):
+        def check(expe):
+            # 与逐个元件重新统计坐标的结果一致
+            position2elements = {}
+            for a_element in expe.Elements:
+                position2elements.setdefault(a_element._position, []).append(a_element)
+            self.assertEqual(
+                {position: set(elements) for position, elements in expe._position2elements.items()},
+                {position: set(elements) for position, elements in position2elements.items()},
+            )
+            self.assertEqual(expe._element2position, {a_element: a_element._position for a_element in expe.Elements})
+            for position, elements in position2elements.items():
+                self.assertEqual(set(expe.get_element_from_position(*position)), set(elements))
+
+        rng = random.Random(0)
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            elements = [Logic_Input(i % 3, 0, 0) for i in range(30)]
+            for _ in range(300):
+                op = rng.random()
+                if op < 0.6:
+                    rng.choice(elements).set_position(rng.randrange(4), rng.randrange(2), 0)
+                elif op < 0.8 and len(elements) > 1:
+                    a_element = elements.pop(rng.randrange(len(elements)))
+                    expe.del_element(a_element)
+                    self.assertRaises(ValueError, lambda: expe.Elements.index(a_element))
+                else:
+                    elements.append(Logic_Output(rng.randrange(4), 0, 0))
+                check(expe)
+            self.assertRaises(errors.ElementNotFound, lambda: expe.get_element_from_position(10, 0, 0))
+            expe.save(no_print_info=True)
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, expe.SAV_PATH) as expe:
+            check(expe)
+            expe.close(delete=True)
+
     @my_test_dec
     def test_del_element(self):
         with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
@@ -309,6 +351,604 @@ class BasicTest(TestCase, ViztracerTool):
             self.assertEqual(expe.get_elements_count(), 6)
             expe.close()
 
+    @my_test_dec
+    def test_get_index_after_del_element(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            elements = [Logic_Input(i, 0, 0) for i in range(10)]
+            expe.del_element(elements[3])
+            expe.del_element(elements[0])
+            self.assertEqual(expe.get_elements_count(), 8)
+            self.assertEqual(elements[1].get_index(), 1)
+            self.assertEqual(elements[9].get_index(), 8)
+            self.assertIs(expe.get_element_from_index(3), elements[4])
+            self.assertEqual(list(expe.Elements), elements[1:3] + elements[4:])
+            expe.close(delete=True)
+
+    def test_element_list(self):
+        rng = random.Random(0)
+        elements = _ElementList()
+        expected = []
+        for _ in range(2000):
+            op = rng.random()
+            if len(expected) <= 1 or op < 0.55:
+                a_element = object()
+                elements.append(a_element)
+                expected.append(a_element)
+            elif op < 0.8:
+                a_element = rng.choice(expected)
+                elements.remove(a_element)
+                expected.remove(a_element)
+            elif op < 0.9:
+                i = rng.randrange(-len(expected), len(expected))
+                self.assertIs(elements.pop(i), expected.pop(i))
+            elif op < 0.98:
+                i = rng.randrange(len(expected))
+                del elements[i]
+                del expected[i]
+            else:
+                a_element = object()
+                elements.insert(1, a_element)
+                expected.insert(1, a_element)
+            stamps_count = elements._stamps_count
+            self.assertEqual(elements, expected)
+            for i in {0, len(expected) // 2, len(expected) - 1}:
+                self.assertEqual(elements.index(expected[i]), i)
+                self.assertIn(expected[i], elements)
+            # 获取index不会重新编号
+            self.assertEqual(elements._stamps_count, stamps_count)
+        self.assertRaises(ValueError, lambda: elements.index(object()))
+        self.assertRaises(ValueError, lambda: elements.index(expected[0], 1))
+        self.assertRaises(ValueError, lambda: elements.remove(object()))
+        self.assertNotIn(object(), elements)
+        self.assertNotIn([], elements)
+
+        # 其余操作与list一致
+        self.assertIsInstance(elements, list)
+        self.assertEqual(elements + [1], expected + [1])
+        self.assertEqual(elements[1:-1:2], expected[1:-1:2])
+        self.assertEqual(copy.copy(elements), expected)
+        self.assertIs(type(copy.copy(elements)), _ElementList)
+        elements.reverse()
+        expected.reverse()
+        elements[0:2] = [elements[1], elements[0]]
+        expected[0:2] = [expected[1], expected[0]]
+        elements[2] = object()
+        expected[2] = elements[2]
+        del elements[::3]
+        del expected[::3]
+        elements += [object()]
+        expected.append(elements[-1])
+        for i, a_element in enumerate(expected):
+            self.assertEqual(elements.index(a_element), i)
+        # Elements中的元件不能重复
+        self.assertRaises(ValueError, lambda: elements.append(expected[0]))
+        self.assertRaises(ValueError, lambda: elements.extend([object()] * 2))
+        self.assertRaises(ValueError, elements.__setitem__, 0, expected[1])
+        self.assertEqual(elements, expected)
+        elements.clear()
+        self.assertEqual(len(elements), 0)
+
+    @my_test_dec
+    def test_get_wires(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Or_Gate(0, 0, 0)
+            b = Logic_Input(1, 0, 0)
+            c = Logic_Output(2, 0, 0)
+            crt_wire(b.o, a.i_up, c.i)
+            crt_wire(b.o, a.i_low)
+            self.assertEqual(len(b.o.get_wires()), 2)
+            self.assertEqual(len(a.i_up.get_wires()), 2)
+            self.assertEqual(a.o.get_wires(), [])
+            del_wire(a.i_up, c.i)
+            self.assertEqual(len(a.i_up.get_wires()), 1)
+            expe.del_element(a)
+            self.assertEqual(b.o.get_wires(), [])
+            self.assertEqual(expe.get_wires_count(), 0)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_crt_elements(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = expe.crt_elements("And Gate", [(i, 0, 0) for i in range(10)], elementXYZ=True)
+            b = expe.crt_elements(Logic_Input, [(0, 1, 0), (0, 1, 0)], output_status=True)
+            self.assertEqual(expe.get_elements_count(), 12)
+            self.assertEqual(len(expe.get_element_from_position(0, 1, 0)), 2)
+            self.assertEqual(a[3].data["Position"], And_Gate(3, 0, 0, elementXYZ=True).data["Position"])
+            self.assertTrue(b[1].output_status)
+            self.assertIsNot(b[0].properties, b[1].properties)
+            self.assertIs(expe.get_element_from_identifier(a[5].data["Identifier"]), a[5])
+            crt_wire(a[0].o, b[0].o)
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.close(delete=True)
+
+    def test_rand_strings(self):
+        strings = randStrings(1000, 33)
+        self.assertEqual(len(set(strings)), 1000)
+        self.assertTrue(all(len(a_string) == 33 and a_string.isalnum() and a_string.isascii() for a_string in strings))
+        # 每个字符出现的概率相同, 62个字符都应出现
+        self.assertEqual(len(set("".join(strings))), 62)
+        self.assertTrue(all(a_string.islower() or a_string.isdigit() for a_string in randStrings(100, 8, is_lower=True)))
+
+    @my_test_dec
+    def test_save_compact(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = Logic_Output(1, 0, 0, elementXYZ=True)
+            crt_wire(a.o, b.i)
+            expe.save(no_print_info=True)
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                indented = json.load(f)
+            expe.save(no_print_info=True, compact=True)
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                self.assertNotIn("\n", f.read())
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                compacted = json.load(f)
+            self.assertEqual(
+                json.loads(indented["Experiment"]["StatusSave"]),
+                json.loads(compacted["Experiment"]["StatusSave"]),
+            )
+            self.assertEqual(len(json.loads(compacted["Experiment"]["StatusSave"])["Wires"]), 1)
+            # 保存之后PlSav与写入的存档一致
+            self.assertEqual(expe.PlSav, compacted)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_search_experiment(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            expe.save(no_print_info=True)
+            self.assertEqual(search_experiment("__test__")[0], os.path.basename(expe.SAV_PATH))
+            # 索引存放在physicsLab的缓存目录中, 而不是物实的存档目录中
+            self.assertTrue(os.path.exists(_get_sav_index()._path()))
+            self.assertNotEqual(os.path.dirname(_get_sav_index()._path()), os.path.abspath(Experiment.SAV_PATH_DIR))
+            expe.entitle("__test_search_experiment__")
+            expe.save(no_print_info=True)
+            # 原地修改存档不会改变存档目录的修改时间, 因此不会重新扫描目录
+            self.assertEqual(_get_sav_index().find("__test_search_experiment__"), [])
+            self.assertEqual(search_experiment("__test__"), (None, None))
+            self.assertEqual(search_experiment("__test_search_experiment__")[0], os.path.basename(expe.SAV_PATH))
+            expe.close(delete=True)
+        self.assertEqual(search_experiment("__test_search_experiment__"), (None, None))
+
+    def test_probe_sav(self):
+        info = probe_sav(os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav"), count_elements=True)
+        self.assertEqual(info.experiment_type, ExperimentType.Circuit)
+        self.assertEqual(info.internal_name, "all circuit elements")
+        self.assertEqual(info.components, 91)
+        self.assertEqual(info.elements_count, 91)
+        self.assertEqual(info.wires_count, 0)
+        info = probe_sav(os.path.join(TEST_DATA_DIR, "Export-All-Celestial-Elements.sav"))
+        self.assertEqual(info.experiment_type, ExperimentType.Celestial)
+        self.assertIsNone(info.internal_name)
+        self.assertIsNone(info.elements_count)
+        self.assertRaises(InvalidSavError, lambda: probe_sav(os.path.join(TEST_DATA_DIR, "invalid.sav")))
+
+    def test_load_savs(self):
+        res = load_savs(TEST_DATA_DIR, max_workers=2)
+        self.assertNotIn(os.path.join(TEST_DATA_DIR, "invalid.sav"), res)
+        summary = res[os.path.join(TEST_DATA_DIR, "All-Celestial-Elements.sav")]
+        self.assertEqual(summary.experiment_type, ExperimentType.Celestial)
+        self.assertEqual(sum(summary.elements.values()), 27)
+        summary = load_savs([os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav")], max_workers=1)
+        self.assertEqual(list(summary.values())[0].elements["Multiplier"], 2)
+
+    @my_test_dec
+    def test_fast_load(self):
+        with Experiment(OpenMode.load_by_filepath, os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav"), fast_load=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 91)
+            a = expe.get_element_from_index(1)
+            self.assertIs(expe.get_element_from_identifier(a.data["Identifier"]), a)
+            self.assertIn(a, expe.get_element_from_position(*a.get_position()))
+            expe.close()
+        with Experiment(OpenMode.load_by_filepath, os.path.join(TEST_DATA_DIR, "All-Celestial-Elements.sav"), fast_load=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 27)
+            expe.close()
+        self.assertRaises(TypeError, lambda: Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, fast_load=True))
+
+    @my_test_dec
+    def test_lazy_load(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = Logic_Output(1, 0, 0)
+            crt_wire(a.o, b.i)
+            identifier = a.data["Identifier"]
+            expe.save(no_print_info=True)
+            sav_path = expe.SAV_PATH
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, sav_path, lazy=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 2)
+            self.assertEqual(expe.get_wires_count(), 1)
+            a = expe.get_element_from_identifier(identifier)
+            self.assertIs(expe.get_element_from_identifier(identifier), a)
+            a.output_status = True
+            expe.save(no_print_info=True)
+            self.assertEqual(len(expe.get_element_from_position(1, 0, 0)), 1)
+            self.assertEqual(a.get_index(), 1)
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, sav_path) as expe:
+            self.assertTrue(expe.get_element_from_identifier(identifier).output_status)
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_columnar_load(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = Logic_Input(1, 0, 0)
+            c = Logic_Output(0.1, 0.2, 0.3)
+            crt_wire(a.o, c.i)
+            identifier = a.data["Identifier"]
+            expe.save(no_print_info=True)
+            sav_path = expe.SAV_PATH
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, sav_path, columnar=True) as expe:
+            a = expe.get_element_from_identifier(identifier)
+            b, c = expe.get_element_from_index(2), expe.get_element_from_index(3)
+            self.assertEqual(expe.get_wires_count(), 1)
+            self.assertEqual(a.data["ModelID"], "Logic Input")
+            self.assertEqual(c.get_position(), (0.1, 0.2, 0.3))
+            self.assertEqual(c.data["Position"], "0.1,0.3,0.2")
+            a.output_status = True
+            self.assertFalse(b.output_status)  # 修改a不会影响共享模板的b
+            b.set_position(2, 0, 0)
+            self.assertEqual(expe.get_element_from_position(2, 0, 0), [b])
+            expe.save(no_print_info=True)
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, sav_path) as expe:
+            self.assertTrue(expe.get_element_from_identifier(identifier).output_status)
+            self.assertFalse(expe.get_element_from_index(2).output_status)
+            self.assertEqual(expe.get_element_from_index(2).data["Position"], "2,0,0")
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_columnar_save_same_as_fast_load(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            for i in range(3):
+                Logic_Input(i, 0, 0)
+            expe.save(no_print_info=True)
+            sav_path = expe.SAV_PATH
+            expe.close()
+        # 存档中的坐标与角度不一定是Python生成的写法
+        with open(sav_path, encoding="utf-8") as f:
+            plsav = json.load(f)
+        status_sav = json.loads(plsav["Experiment"]["StatusSave"])
+        vectors = (("1.50,0,-0.0", "0,180.0,0"), ("1e-05,0.10000000000000001,0", "0,0,90"), ("2,0,0", "0.0,0,0"))
+        for element, (position, rotation) in zip(status_sav["Elements"], vectors):
+            element["Position"], element["Rotation"] = position, rotation
+        plsav["Experiment"]["StatusSave"] = json.dumps(status_sav)
+        with open(sav_path, "w", encoding="utf-8") as f:
+            json.dump(plsav, f)
+
+        def read_status_save(path: str) -> str:
+            # 存档中的时间戳等信息每次保存都不同, 只比较StatusSave
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["Experiment"]["StatusSave"]
+
+        outputs = []
+        target_path = sav_path + ".out"
+        for kwargs in ({"fast_load": True}, {"columnar": True}):
+            with Experiment(OpenMode.load_by_filepath, sav_path, **kwargs) as expe:
+                expe.save(target_path=target_path, no_print_info=True)
+                unchanged = read_status_save(target_path)
+                expe.get_element_from_index(1).set_position(0.5, 0, 0)
+                expe.save(target_path=target_path, no_print_info=True)
+                changed = read_status_save(target_path)
+                expe.close()
+            outputs.append((unchanged, changed))
+        os.remove(target_path)
+        os.remove(sav_path)
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn('"1.50,0,-0.0"', outputs[1][0])
+        self.assertIn('"1e-05,0.10000000000000001,0"', outputs[1][1])
+        self.assertNotIn('"1.50,0,-0.0"', outputs[1][1])
+
+    @my_test_dec
+    def test_incremental_save(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = Logic_Output(1, 0, 0)
+            c = Logic_Output(2, 0, 0)
+            crt_wire(a.o, b.i)
+            expe.save(no_print_info=True)
+            self.assertIsNotNone(a._fragment)
+
+            # 默认的save不使用缓存, 保存之后修改之前获取的properties也会被写入存档
+            properties = a.properties
+            expe.save(no_print_info=True)
+            properties["开关"] = 1
+            expe.save(no_print_info=True)
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                elements = json.loads(json.load(f)["Experiment"]["StatusSave"])["Elements"]
+            self.assertEqual(elements[0]["Properties"]["开关"], 1)
+            properties["开关"] = 0
+
+            a.output_status = True
+            self.assertIsNone(a._fragment)
+            self.assertIsNotNone(b._fragment)
+            b.set_position(1, 1, 0)
+            crt_wire(a.o, c.i)
+            expe.del_element(c)
+            expe.save(no_print_info=True, incremental=True)
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                status_save = json.load(f)["Experiment"]["StatusSave"]
+            expe.save(no_print_info=True)
+            with open(expe.SAV_PATH, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["Experiment"]["StatusSave"], status_save)
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, expe.SAV_PATH) as expe:
+            self.assertTrue(expe.get_element_from_index(1).output_status)
+            self.assertEqual(len(expe.get_element_from_position(1, 1, 0)), 1)
+            self.assertEqual(expe.get_elements_count(), 2)
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_sav_cache(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            crt_wire(a.o, Logic_Output(1, 0, 0).i)
+            expe.save(no_print_info=True)
+            sav_path = expe.SAV_PATH
+            expe.close()
+
+        with Experiment(OpenMode.load_by_filepath, sav_path, cache=True) as expe:
+            self.assertTrue(os.path.exists(sav_path + ".cache"))
+            self.assertEqual(expe.get_wires_count(), 1)
+            expe.close()
+        with Experiment(OpenMode.load_by_sav_name, "__test__", cache=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 2)
+            self.assertEqual(expe.get_wires_count(), 1)
+            Logic_Output(2, 0, 0)
+            expe.save(no_print_info=True)  # 存档被修改后缓存失效
+            expe.close()
+        with Experiment(OpenMode.load_by_filepath, sav_path, cache=True) as expe:
+            self.assertEqual(expe.get_elements_count(), 3)
+            expe.close(delete=True)
+        self.assertFalse(os.path.exists(sav_path + ".cache"))
+        self.assertRaises(TypeError, lambda: Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, cache=True))
+
+        # 存档中的Summary为null, 读取时会以含Generate的模板代替
+        sav_path = os.path.join(Experiment.SAV_PATH_DIR, "__test_cache_celestial__.sav")
+        shutil.copyfile(os.path.join(TEST_DATA_DIR, "All-Celestial-Elements.sav"), sav_path)
+        for _ in range(2):
+            with Experiment(OpenMode.load_by_filepath, sav_path, cache=True) as expe:
+                self.assertTrue(os.path.exists(sav_path + ".cache"))
+                self.assertFalse(os.path.exists(sav_path + ".cache.tmp"))
+                self.assertEqual(expe.get_elements_count(), 27)
+                expe.save(target_path=os.devnull)
+                expe.close()
+        os.remove(sav_path)
+        os.remove(sav_path + ".cache")
+
+    @my_test_dec
+    def test_open_sav_encodings(self):
+        with open(os.path.join(TEST_DATA_DIR, "All-Circuit-Elements.sav"), encoding="utf-8") as f:
+            context = f.read()
+        sav_path = os.path.join(Experiment.SAV_PATH_DIR, "__test_encoding__.sav")
+        for data in (
+            b"\xef\xbb\xbf" + context.encode("utf-8"),
+            context.encode("utf-16"),
+            context.encode("gbk"),
+        ):
+            with open(sav_path, "wb") as f:
+                f.write(data)
+            with Experiment(OpenMode.load_by_filepath, sav_path) as expe:
+                self.assertEqual(expe.get_elements_count(), 91)
+                expe.close(delete=True)
+
+    def test_json_backend(self):
+        from physicsLab import _json
+        for context in ('{"a": [1, 2.5, "\\u7269"]}', '[NaN, -Infinity]', '[1e-05, 9007199254740993]'):
+            self.assertEqual(repr(_json.loads(context)), repr(json.loads(context)))
+            self.assertEqual(repr(_json.loads(context.encode("utf-8"))), repr(json.loads(context)))
+        self.assertEqual(_json.loads_buffer(bytearray(b'{"a": 1}')), {"a": 1})
+        self.assertRaises(json.JSONDecodeError, lambda: _json.loads("{"))
+
+    @my_test_dec
+    def test_select_transform(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(1, 2, 0)
+            b = And_Gate(1, 0, 0, elementXYZ=True)
+            c = Logic_Output(5, 5, 0)
+            selection = expe.select(box=((0, 0, 0), (2, 2, 0)))
+            self.assertEqual(set(selection), {a, b})
+            self.assertEqual(list(expe.select(model_id="Logic Output")), [c])
+            self.assertEqual(len(expe.select(lambda e: e.is_elementXYZ)), 1)
+
+            selection.translate(1, 0, 0)
+            self.assertEqual(a.get_position(), (2, 2, 0))
+            self.assertEqual(b.data["Position"], "1.16,0.0,0.0")
+            self.assertEqual(expe.get_element_from_position(2, 2, 0), [a])
+            self.assertRaises(ElementNotFound, lambda: expe.get_element_from_position(1, 2, 0))
+
+            expe.select(lambda e: e is a).rotate(90, (0, 0))
+            self.assertEqual(a.get_position(), (2, -2, 0))
+            self.assertEqual(a.data["Rotation"], "0,270,0")
+            expe.select(lambda e: e is a).mirror("y", 0)
+            self.assertEqual(a.get_position(), (2, 2, 0))
+            self.assertEqual(a.data["Rotation"], "0,270,0")
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_select_after_origin_change(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            with ElementXYZ(0, 0, 0):
+                a = Logic_Input(1, 0, 0)
+                b = Full_Adder(2, 0, 0)
+            # 修改元件坐标系的原点不应影响已经创建的元件
+            ElementXYZ(5, 0, 0)
+            expe.select().translate(0, 0, 0)
+            self.assertEqual(a.data["Position"], "0.16,0.0,0.0")
+            self.assertEqual(b.data["Position"], "0.32,0.0,0.045")
+            self.assertEqual(a.get_position(), (1, 0, 0))
+
+            expe.select(lambda e: e is a).translate(1, 0, 0, elementXYZ=True)
+            self.assertEqual(a.data["Position"], "0.32,0.0,0.0")
+            self.assertEqual(a.get_position(), (2, 0, 0))
+
+            # 选中之后被删除的元件不会被移动, 也不会被重新加入索引
+            selection = expe.select()
+            expe.del_element(b)
+            selection.translate(1, 0, 0)
+            self.assertEqual(list(selection), [a])
+            self.assertEqual(expe.get_elements_count(), 1)
+            self.assertEqual(expe.elements_in_box((-10, -10, -10), (10, 10, 10)), [a])
+            self.assertFalse(expe.is_occupied(1.32, 0, 0.045))
+            self.assertRaises(ElementNotFound, lambda: expe.get_element_from_position(3, 0, 0))
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_spatial_query(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            b = And_Gate(1, 0, 0, elementXYZ=True)
+            self.assertIs(expe.nearest_element(0.1, 0, 0), b)
+            self.assertTrue(expe.is_occupied(0, 0, 0))
+            self.assertFalse(expe.is_occupied(0.05, 0, 0))
+            self.assertTrue(expe.is_occupied(0.05, 0, 0, 0.05))
+
+            c = Logic_Output(3, 3, 0)
+            self.assertEqual(expe.elements_in_box((2, 2, 0), (4, 4, 0)), [c])
+            a.set_position(5, 5, 0)
+            self.assertIs(expe.nearest_element(4.9, 5, 0), a)
+            expe.del_element(a)
+            self.assertIs(expe.nearest_element(4.9, 5, 0), c)
+            self.assertEqual(set(expe.elements_in_box((0, 0, 0), (1, 0, 0), elementXYZ=True)), {b})
+
+            expe.clear_elements()
+            self.assertRaises(ElementNotFound, lambda: expe.nearest_element(0, 0, 0))
+            expe.close(delete=True)
+
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            # 空间索引使用存档中的物实坐标, 与之后元件坐标系的原点无关
+            with ElementXYZ(0, 0, 0):
+                d = Logic_Input(1, 0, 0)
+            ElementXYZ(5, 0, 0)
+            self.assertEqual(expe.elements_in_box((0, -1, -1), (1, 1, 1)), [d])
+            self.assertIs(expe.nearest_element(0.16, 0, 0), d)
+            self.assertTrue(expe.is_occupied(0.16, 0, 0))
+            expe.close(delete=True)
+
+    @my_test_dec
+    def test_wire_hash(self):
+        expe = Experiment(
+            OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True
+        )
+        a = Full_Adder(0, 0, 0)
+        b = Full_Adder(1, 0, 0)
+        self.assertEqual(Wire(a.i_up, b.o_up), Wire(b.o_up, a.i_up))
+        self.assertEqual(hash(Wire(a.i_up, b.o_up)), hash(Wire(b.o_up, a.i_up)))
+        # 引脚的label之和相同的导线
+        wires = {
+            Wire(a.o_up, a.i_mid),
+            Wire(a.o_low, a.i_up),
+            Wire(a.i_mid, a.o_up, color=WireColor.red),
+        }
+        self.assertEqual(len(wires), 2)
+        self.assertNotEqual(Wire(a.o_up, a.i_mid), Wire(a.o_low, a.i_up))
+        self.assertNotEqual(Wire(a.o_up, b.i_up), Wire(b.o_up, a.i_up))
+        expe.close(delete=True)
+
+    @my_test_dec
+    def test_crt_wires_between(self):
+        expe = Experiment(
+            OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True
+        )
+        inputs = [Logic_Input(i, 0, 0) for i in range(4)]
+        outputs = [Logic_Output(i, 1, 0) for i in range(4)]
+        crt_wires_between([a.o for a in inputs[:2]], [b.i for b in outputs[:2]])
+        crt_wires_between(
+            [(a, 0) for a in inputs], [(b, 0) for b in outputs], color=WireColor.red
+        )
+        self.assertEqual(expe.get_wires_count(), 4)
+        self.assertEqual(outputs[3].i.get_wires(), [Wire(inputs[3].o, outputs[3].i)])
+        self.assertRaises(ValueError, crt_wires_between, [inputs[0].o], [])
+        self.assertRaises(
+            ValueError, crt_wires_between, [(inputs[0], 1)], [(outputs[0], 0)]
+        )
+        self.assertRaises(
+            errors.InvalidWireError, crt_wires_between, [inputs[0].o], [inputs[0].o]
+        )
+        expe.close(delete=True)
+
+    @my_test_dec
+    def test_pin_interning(self):
+        expe = Experiment(
+            OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True
+        )
+        a = Full_Adder(0, 0, 0)
+        self.assertIs(a.i_up, a.i_up)
+        self.assertIs(Pin(a, a.o_up._pin_label), a.o_up)
+        self.assertIsInstance(a.o_up, OutputPin)
+        # 也可以通过关键字参数创建引脚
+        self.assertIs(Pin(input_self=a, _pin_label=a.o_up._pin_label), a.o_up)
+        self.assertIs(OutputPin(a, pinLabel=a.o_up._pin_label), a.o_up)
+        self.assertRaises(TypeError, lambda: Pin(a))
+        self.assertIsNot(a.i_up, Full_Adder(1, 0, 0).i_up)
+        # 合并后的元件的引脚属于新的元件
+        a_wire = crt_wire(a.o_up, a.i_up)[0]
+        expe2 = Experiment(
+            OpenMode.crt, "__test2__", ExperimentType.Circuit, force_crt=True
+        )
+        expe2.merge(expe)
+        b = expe2.Elements[0]
+        self.assertIs(b.o_up.element_self, b)
+        self.assertEqual(b.o_up.get_wires(), [Wire(b.o_up, b.i_up)])
+        self.assertIsNot(b.o_up, a_wire.Source)
+        expe2.close(delete=True)
+        expe.close(delete=True)
+
+    @my_test_dec
+    def test_netlist(self):
+        expe = Experiment(
+            OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True
+        )
+        a = Logic_Input(0, 0, 0)
+        b = Yes_Gate(1, 0, 0)
+        c = Logic_Output(2, 0, 0)
+        d = Logic_Output(3, 0, 0)
+        crt_wire(a.o, b.i)
+        netlist = expe.get_netlist()
+        crt_wire(b.o, c.i, d.i)
+        self.assertTrue(netlist.is_connected(b.o, d.i))
+        self.assertFalse(netlist.is_connected(a.o, c.i))
+        self.assertEqual(netlist.get_net(c.i), {b.o, c.i, d.i})
+        self.assertEqual(len(netlist.get_nets()), 2)
+        self.assertEqual(netlist.count_fan_out(b.o), 2)
+        self.assertEqual(netlist.count_fan_in(d.i), 1)
+        self.assertEqual(netlist.find_path(b.o, d.i), [b.o, c.i, d.i])
+        self.assertIsNone(netlist.find_path(a.o, d.i))
+
+        del_wire(b.o, c.i)
+        self.assertFalse(netlist.is_connected(b.o, d.i))
+        self.assertEqual(netlist.count_fan_out(b.o), 0)
+        self.assertEqual(netlist.get_net(b.o), {b.o})
+        expe.clear_wires()
+        self.assertEqual(netlist.get_nets(), [])
+        expe.close(delete=True)
+
+    @my_test_dec
+    def test_crt_element_by_name(self):
+        with Experiment(OpenMode.crt, "__test__", ExperimentType.Circuit, force_crt=True) as expe:
+            self.assertIsInstance(expe.crt_element("555 Timer", 0, 0, 0), NE555)
+            self.assertIsInstance(expe.crt_element("And_Gate", 0, 0, 0), And_Gate)
+            a = expe.crt_element("Logic Input", 0, 0, 0, output_status=True, identifier="a" * 34)
+            self.assertTrue(a.output_status)
+            self.assertIs(expe.get_element_from_identifier("a" * 34), a)
+            self.assertRaises(ElementNotFound, lambda: expe.crt_element("Earth", 0, 0, 0))
+            expe.close(delete=True)
+
+    def test_parse_vectors(self):
+        self.assertEqual(parse_vectors(["0,1.5,-2", "1E-05, .5, 3."]), [(0, 1.5, -2), (1e-05, 0.5, 3.0)])
+        self.assertEqual(parse_vectors([]), [])
+        self.assertRaises(ValueError, lambda: parse_vectors(["1,2"]))
+        self.assertRaises(ValueError, lambda: parse_vectors(["1,2,__import__('os')"]))
+
     # 测试模块化电路连接导线
     @my_test_dec
     def test_wires(self):
@@ -511,6 +1151,30 @@ class BasicTest(TestCase, ViztracerTool):
                 exp2.close(delete=True)
             expe.close(delete=True)
 
+    @my_test_dec
+    def test_merge_experiment_twice(self):
+        with Experiment(OpenMode.crt, "__test___merge_experiment__", ExperimentType.Circuit, force_crt=True) as expe:
+            a = Logic_Input(0, 0, 0)
+            crt_wire(a.o, Logic_Output(1, 0, 0, elementXYZ=True).i)
+
+            with Experiment(OpenMode.crt, "__test___merge_experiment_sub__", ExperimentType.Circuit, force_crt=True) as exp2:
+                exp2.merge(expe, 0, 0, 0, elementXYZ=True)
+                exp2.merge(expe, 0, 2, 0, elementXYZ=True)
+
+                self.assertEqual(exp2.get_elements_count(), 4)
+                self.assertEqual(exp2.get_wires_count(), 2)
+                self.assertEqual(len({e.data["Identifier"] for e in exp2.Elements} | {a.data["Identifier"]}), 5)
+                for e in exp2.Elements:
+                    self.assertIs(exp2.get_element_from_identifier(e.data["Identifier"]), e)
+                    self.assertIs(e.experiment, exp2)
+                for a_wire in exp2.Wires:
+                    self.assertIn(a_wire.Source.element_self, exp2.Elements)
+                    self.assertIn(a_wire.Target.element_self, exp2.Elements)
+                self.assertEqual(len(exp2.get_element_from_position(1, 2, 0)), 1)
+                self.assertEqual(a.get_position(), (0, 0, 0))
+                exp2.close(delete=True)
+            expe.close(delete=True)
+
     @my_test_dec
     def test_link_wire_in_two_experiment(self):
         with Experiment(OpenMode.crt, "__test___link_wire_in_two_experiment__", ExperimentType.Circuit, force_crt=True) as expe:
@@ -620,6 +1284,10 @@ class BasicTest(TestCase, ViztracerTool):
     def test_get_pin_name(self):
         with Experiment(OpenMode.crt, "__test___get_pin_name__", ExperimentType.Circuit, force_crt=True) as expe:
             self.assertEqual(Multiplier(0, 0, 0).i_low.get_pin_name(), "i_low")
+            # 第二次获取时使用缓存的引脚表
+            for a_element in (Multiplier(1, 0, 0), Full_Adder(2, 0, 0)):
+                for name, a_pin in a_element.get_all_pins_property():
+                    self.assertEqual(a_pin.fget(a_element).get_pin_name(), name)
             expe.close(delete=True)
 
     @my_test_dec